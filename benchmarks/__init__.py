@@ -0,0 +1 @@
+"""Benchmarks for the Turmeric integration (not shipped with the integration)."""
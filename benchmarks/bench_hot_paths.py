@@ -0,0 +1,249 @@
+"""Benchmark Turmeric's coordinator and sensor hot paths on large lists.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.bench_hot_paths --groceries 10000 --meals 5000
+    python -m benchmarks.bench_hot_paths --capture path/to/<entry_id>.jsonl
+
+Each benchmark reports the median and best wall time over `--repeat` runs
+and the peak memory allocated during one extra run traced by tracemalloc.
+Network requests are answered in memory, so the update cycle measures
+decoding, validation, change detection and view building only.
+"""
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.turmeric.coordinator import TurmericCoordinator
+from custom_components.turmeric.parser import parse_collection
+from custom_components.turmeric.sensor import TurmericSensor
+
+from .payloads import (
+    load_capture,
+    make_grocery_lists,
+    make_groceries,
+    make_meals,
+    make_status,
+)
+
+
+class _Response:
+    """The parts of an aiohttp response read by the coordinator."""
+
+    status = 200
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+        self.headers: dict[str, str] = {}
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+def _report(label: str, times: list[float], peak: int) -> dict:
+    """Print one result row and return it for the JSON report."""
+    result = {
+        "benchmark": label,
+        "median_ms": statistics.median(times) * 1000,
+        "best_ms": min(times) * 1000,
+        "peak_kib": peak / 1024,
+    }
+    print(
+        f"{label:<34} {result['median_ms']:>10.3f} {result['best_ms']:>10.3f}"
+        f" {result['peak_kib']:>12.1f}"
+    )
+    return result
+
+
+def measure(label: str, func, repeat: int) -> dict:
+    """Time `func()` `repeat` times, then trace one more call for memory."""
+    gc.collect()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return _report(label, times, peak)
+
+
+async def measure_async(label: str, func, repeat: int) -> dict:
+    """Like `measure` for a coroutine function."""
+    gc.collect()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    await func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return _report(label, times, peak)
+
+
+def _make_coordinator(hass: HomeAssistant) -> TurmericCoordinator:
+    """Create a coordinator for an in-memory config entry."""
+    entry = SimpleNamespace(
+        entry_id="benchmark",
+        title="Benchmark",
+        data={"api_token": "benchmark-token"},
+        options={},
+        async_on_unload=lambda func: None,
+        async_create_background_task=lambda hass, target, name: (
+            hass.async_create_background_task(target, name)
+        ),
+    )
+    return TurmericCoordinator(hass, entry, 360, 720)
+
+
+async def run(args: argparse.Namespace) -> list[dict]:
+    """Run every benchmark and return the results."""
+    if args.capture:
+        captured = load_capture(args.capture)
+        if "groceries" not in captured or "meals" not in captured:
+            raise SystemExit(f"{args.capture} has no recorded groceries and meals")
+        groceries, meals = captured["groceries"], captured["meals"]
+        grocery_lists = captured.get("grocerylists", {"result": []})
+    else:
+        groceries = make_groceries(args.groceries)
+        meals = make_meals(args.meals)
+        grocery_lists = make_grocery_lists()
+
+    # Two versions of each body, so every update cycle sees a change
+    changed_groceries = {**groceries, "result": groceries["result"][1:]}
+    changed_meals = {**meals, "result": meals["result"][1:]}
+    bodies = {
+        "groceries": [json.dumps(groceries).encode(), json.dumps(changed_groceries).encode()],
+        "meals": [json.dumps(meals).encode(), json.dumps(changed_meals).encode()],
+        # List metadata stays the same, so it is skipped by its body digest
+        "grocerylists": [json.dumps(grocery_lists).encode()] * 2,
+    }
+    print(
+        f"{len(groceries['result'])} grocery items "
+        f"({len(bodies['groceries'][0]) / 1e6:.1f} MB), "
+        f"{len(meals['result'])} meals ({len(bodies['meals'][0]) / 1e6:.1f} MB)\n"
+    )
+    print(f"{'benchmark':<34} {'median ms':>10} {'best ms':>10} {'peak KiB':>12}")
+
+    results = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinator = _make_coordinator(hass)
+
+        results.append(
+            measure(
+                "parse groceries",
+                lambda: parse_collection("groceries", groceries["result"]),
+                args.repeat,
+            )
+        )
+        results.append(
+            measure(
+                "parse meals",
+                lambda: parse_collection("meals", meals["result"]),
+                args.repeat,
+            )
+        )
+
+        states = coordinator.collections
+        results.append(
+            measure(
+                "parse + build groceries view",
+                lambda: coordinator._set_records(
+                    states["groceries"], coordinator._parse(states["groceries"], groceries)
+                ),
+                args.repeat,
+            )
+        )
+        results.append(
+            measure(
+                "parse + build meals view",
+                lambda: coordinator._set_records(
+                    states["meals"], coordinator._parse(states["meals"], meals)
+                ),
+                args.repeat,
+            )
+        )
+        coordinator.data = coordinator._build_data()
+
+        for sensor_type in ("groceries", "meals"):
+            sensor = TurmericSensor(coordinator, sensor_type)
+            results.append(
+                measure(f"sensor.{sensor_type} state", lambda: sensor.state, args.repeat)
+            )
+            results.append(
+                measure(
+                    f"sensor.{sensor_type} attributes",
+                    lambda: sensor.extra_state_attributes,
+                    args.repeat,
+                )
+            )
+
+        cycle = 0
+
+        async def api_get(endpoint, max_retries=3, priority=0.0, state=None):
+            """Answer coordinator requests from the pre-encoded bodies."""
+            if endpoint == "status":
+                return make_status(cycle)
+            if endpoint not in bodies:
+                return {"result": []}
+            body = bodies[endpoint][cycle % 2]
+            return await coordinator._async_read_payload(_Response(body), endpoint, state)
+
+        coordinator._api_get = api_get
+
+        async def update_cycle():
+            """Run one full update in which both collections changed."""
+            nonlocal cycle
+            cycle += 1
+            now = dt_util.utcnow()
+            for state in coordinator.collections.values():
+                state.poller.force(now)
+            await coordinator._async_update_data()
+
+        results.append(await measure_async("full update cycle", update_cycle, args.repeat))
+
+    return results
+
+
+def main() -> None:
+    """Parse arguments, run the benchmarks and optionally save a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groceries", type=int, default=10_000)
+    parser.add_argument("--meals", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", metavar="PATH", help="also write results as JSON")
+    parser.add_argument(
+        "--capture",
+        metavar="PATH",
+        help="use the groceries and meals recorded in a capture archive",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(
+                {"groceries": args.groceries, "meals": args.meals, "results": results},
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
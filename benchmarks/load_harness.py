@@ -0,0 +1,190 @@
+"""Drive Turmeric's network layer against the mock Paprika server.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.load_harness
+    python -m benchmarks.load_harness --scenario rate_limited --calls 50
+
+Each scenario logs in with `async_login_paprika`, then issues `--calls`
+concurrent `TurmericCoordinator._api_get` requests through the shared
+scheduler and reports what reached the server: requests, logins, 401s,
+429s and stalled requests, the retry amplification (requests per call) and
+the wall time.
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from types import SimpleNamespace
+
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.turmeric import config_flow, coordinator as coordinator_module
+from custom_components.turmeric.config_flow import async_login_paprika
+from custom_components.turmeric.const import DATA_SCHEDULER, DOMAIN
+from custom_components.turmeric.coordinator import TurmericCoordinator
+from custom_components.turmeric.scheduler import TurmericRequestScheduler
+
+from .mock_paprika import MockBehaviour, MockPaprikaServer
+
+SCENARIOS = {
+    "baseline": MockBehaviour(),
+    "latency": MockBehaviour(latency=0.25),
+    "token_expiry": MockBehaviour(token_ttl=1.0),
+    "token_expiry_jwt": MockBehaviour(token_ttl=1.0, jwt_tokens=True),
+    "short_ttl_jwt": MockBehaviour(token_ttl=120.0, jwt_tokens=True),
+    "rate_limited": MockBehaviour(rate_limit_every=3, retry_after=1.0),
+    "timeouts": MockBehaviour(hang_every=5, hang_for=5.0),
+    "large_gzip": MockBehaviour(gzip=True, groceries=10_000, meals=5_000),
+}
+
+# Request timeouts (seconds) for scenarios whose bodies take longer than
+# `--timeout` to transfer and decode
+SCENARIO_TIMEOUTS = {"large_gzip": 10.0}
+
+# Scenarios with a known number of logins (the initial one included).  A
+# token that lives shorter than the renewal margin must not be renewed
+# ahead of its expiry.
+EXPECTED_LOGINS = {"short_ttl_jwt": 1}
+
+
+def _make_entry(token: str) -> SimpleNamespace:
+    """Return an in-memory config entry with credentials and a token."""
+    entry = SimpleNamespace(
+        entry_id="load-harness",
+        title="Load harness",
+        data={CONF_EMAIL: "cook@example.com", CONF_PASSWORD: "secret", "api_token": token},
+        options={},
+        async_on_unload=lambda func: None,
+    )
+    entry.async_create_background_task = lambda hass, target, name: (
+        hass.async_create_background_task(target, name)
+    )
+    return entry
+
+
+async def run_scenario(name: str, behaviour: MockBehaviour, args) -> dict:
+    """Run one scenario against a fresh server and Home Assistant instance."""
+    server = MockPaprikaServer(behaviour)
+    await server.start()
+    coordinator_module.BASE_URL = server.sync_url
+    coordinator_module.API_TIMEOUT = SCENARIO_TIMEOUTS.get(name, args.timeout)
+    config_flow.LOGIN_URL_V2 = server.login_url_v2
+    config_flow.LOGIN_URL_V1 = server.login_url_v1
+
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            hass.data[DOMAIN] = {
+                DATA_SCHEDULER: TurmericRequestScheduler(hass, args.rate, args.burst)
+            }
+            # Token renewals write the new token back to the entry
+            hass.config_entries = SimpleNamespace(
+                async_update_entry=lambda entry, data: setattr(entry, "data", data)
+            )
+
+            try:
+                started = time.perf_counter()
+                token = await async_login_paprika(
+                    async_get_clientsession(hass), "cook@example.com", "secret"
+                )
+                coordinator = TurmericCoordinator(
+                    hass, _make_entry(token or ""), 360, 720
+                )
+
+                endpoints = ["groceries", "meals", "status"]
+                results = await asyncio.gather(
+                    *(
+                        coordinator._api_get(endpoints[index % len(endpoints)])
+                        for index in range(args.calls)
+                    ),
+                    return_exceptions=True,
+                )
+                wall = time.perf_counter() - started
+            finally:
+                hass.data[DOMAIN][DATA_SCHEDULER].async_shutdown()
+                await hass.async_stop(force=True)
+    finally:
+        await server.stop()
+    failed = [result for result in results if isinstance(result, UpdateFailed)]
+    unexpected = [
+        result
+        for result in results
+        if isinstance(result, BaseException) and not isinstance(result, UpdateFailed)
+    ]
+    if unexpected:
+        raise unexpected[0]
+
+    stats = server.stats
+    return {
+        "scenario": name,
+        "calls": args.calls,
+        "failed": len(failed),
+        "requests": stats.requests,
+        "logins": stats.logins,
+        "401": stats.unauthorized,
+        "429": stats.rate_limited,
+        "stalled": stats.hung,
+        "amplification": stats.requests / args.calls,
+        "mb_sent": stats.bytes_sent / 1e6,
+        "wall_s": wall,
+    }
+
+
+async def run(args) -> None:
+    """Run the selected scenarios and print one row each."""
+    columns = ["scenario", "calls", "failed", "requests", "logins", "401", "429",
+               "stalled", "amplification", "mb_sent", "wall_s"]
+    print(" ".join(f"{column:>13}" for column in columns))
+    problems = []
+    for name in args.scenario or SCENARIOS:
+        try:
+            row = await asyncio.wait_for(
+                run_scenario(name, SCENARIOS[name], args), args.limit
+            )
+        except asyncio.TimeoutError:
+            print(f"{name:>13} did not finish within {args.limit:.0f} s")
+            problems.append(f"{name}: did not finish within {args.limit:.0f} s")
+            continue
+        print(
+            " ".join(
+                f"{row[column]:>13.2f}" if isinstance(row[column], float)
+                else f"{row[column]:>13}"
+                for column in columns
+            )
+        )
+        expected = EXPECTED_LOGINS.get(name)
+        if expected is not None and row["logins"] != expected:
+            problems.append(f"{name}: {row['logins']} logins, expected {expected}")
+        if row["failed"] == row["calls"]:
+            problems.append(f"{name}: every call failed")
+
+    for problem in problems:
+        print(f"FAILED {problem}")
+    if problems:
+        raise SystemExit(1)
+
+
+def main() -> None:
+    """Parse arguments and run the harness."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--calls", type=int, default=30)
+    parser.add_argument(
+        "--rate", type=float, default=20.0, help="scheduler requests per second"
+    )
+    parser.add_argument("--burst", type=int, default=10, help="scheduler burst size")
+    parser.add_argument(
+        "--timeout", type=float, default=2.0, help="request timeout in seconds"
+    )
+    parser.add_argument(
+        "--limit", type=float, default=60.0, help="wall-clock limit per scenario"
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
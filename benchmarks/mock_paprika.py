@@ -0,0 +1,192 @@
+"""Scriptable stand-in for the Paprika login and sync API.
+
+The server answers the endpoints Turmeric uses with synthetic payloads and
+can inject the failure modes the integration has to cope with: latency,
+expiring tokens, 429s with Retry-After, requests that never answer in time
+and large gzipped bodies.  Everything it sees is counted in `stats`.
+
+    server = MockPaprikaServer(MockBehaviour(token_ttl=5, rate_limit_every=4))
+    await server.start()
+    ...  # point the integration at server.sync_url / server.login_url_v2
+    await server.stop()
+"""
+import asyncio
+import base64
+import gzip
+import json
+import secrets
+import socket
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from aiohttp import web
+
+from .payloads import make_grocery_lists, make_groceries, make_meals, make_status
+
+
+@dataclass
+class MockBehaviour:
+    """What the mock server should do; every knob defaults to "behave"."""
+
+    latency: float = 0.0  # seconds added before every response
+    token_ttl: float | None = None  # tokens are rejected with 401 after this
+    jwt_tokens: bool = False  # issue JWTs with an exp claim instead of opaque tokens
+    rate_limit_every: int = 0  # every Nth sync request gets a 429
+    retry_after: float = 1.0  # Retry-After sent with a 429
+    hang_every: int = 0  # every Nth sync request stalls for `hang_for`
+    hang_for: float = 30.0
+    gzip: bool = False  # gzip sync responses (Content-Encoding)
+    groceries: int = 1_000
+    meals: int = 500
+
+
+@dataclass
+class MockStats:
+    """Counters for everything the server saw."""
+
+    requests: int = 0  # sync requests, excluding logins
+    logins: int = 0
+    unauthorized: int = 0
+    rate_limited: int = 0
+    hung: int = 0
+    uploads: int = 0
+    bytes_sent: int = 0
+    by_path: Counter = field(default_factory=Counter)
+
+
+class MockPaprikaServer:
+    """aiohttp server imitating www.paprikaapp.com for one test run."""
+
+    def __init__(self, behaviour: MockBehaviour | None = None) -> None:
+        """Prepare the server and its payloads."""
+        self.behaviour = behaviour or MockBehaviour()
+        self.stats = MockStats()
+        self._tokens: dict[str, float] = {}
+        self._bodies = {
+            "groceries": json.dumps(make_groceries(self.behaviour.groceries)).encode(),
+            "meals": json.dumps(make_meals(self.behaviour.meals)).encode(),
+            "grocerylists": json.dumps(make_grocery_lists()).encode(),
+            "status": json.dumps(make_status()).encode(),
+        }
+        if self.behaviour.gzip:
+            # Compressed once up front: compressing megabytes per request
+            # would block the event loop the client under test runs on.
+            self._bodies = {
+                name: gzip.compress(body) for name, body in self._bodies.items()
+            }
+        self._runner: web.AppRunner | None = None
+        self.url = ""
+
+    @property
+    def sync_url(self) -> str:
+        """Replacement for BASE_URL."""
+        return f"{self.url}/api/v2/sync"
+
+    @property
+    def login_url_v2(self) -> str:
+        """Replacement for LOGIN_URL_V2."""
+        return f"{self.url}/api/v2/account/login/"
+
+    @property
+    def login_url_v1(self) -> str:
+        """Replacement for LOGIN_URL_V1."""
+        return f"{self.url}/api/v1/account/login/"
+
+    async def start(self) -> str:
+        """Start listening on a free localhost port and return the base URL."""
+        app = web.Application()
+        app.router.add_post("/api/{version}/account/login/", self._login)
+        app.router.add_get("/api/v2/sync/{endpoint:.+}", self._sync_get)
+        app.router.add_post("/api/v2/sync/{endpoint:.+}", self._sync_post)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        await web.SockSite(self._runner, sock).start()
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Shut the server down."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def _issue_token(self) -> str:
+        """Return a new token, a JWT when configured so expiry is visible."""
+        if not self.behaviour.jwt_tokens or self.behaviour.token_ttl is None:
+            token = secrets.token_hex(16)
+        else:
+            now = time.time()
+            claims = {"iat": int(now), "exp": now + self.behaviour.token_ttl}
+            body = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=")
+            token = f"e30.{body.decode()}.{secrets.token_hex(8)}"
+        self._tokens[token] = time.monotonic()
+        return token
+
+    def _authorised(self, request: web.Request) -> bool:
+        """Return True if the request carries a live token."""
+        header = request.headers.get("Authorization", "")
+        issued = self._tokens.get(header.removeprefix("Bearer "))
+        if issued is None:
+            return False
+        ttl = self.behaviour.token_ttl
+        return ttl is None or time.monotonic() - issued < ttl
+
+    async def _login(self, request: web.Request) -> web.Response:
+        """Exchange any email/password for a token."""
+        self.stats.logins += 1
+        await asyncio.sleep(self.behaviour.latency)
+        form = await request.post()
+        if not form.get("email") or not form.get("password"):
+            return web.json_response({"error": "invalid credentials"}, status=401)
+        return web.json_response({"result": {"token": self._issue_token()}})
+
+    async def _throttle(self, request: web.Request) -> web.Response | None:
+        """Apply latency and the scripted failures; return an early response."""
+        behaviour = self.behaviour
+        self.stats.requests += 1
+        self.stats.by_path[request.path] += 1
+        count = self.stats.requests
+        await asyncio.sleep(behaviour.latency)
+
+        if behaviour.hang_every and count % behaviour.hang_every == 0:
+            self.stats.hung += 1
+            await asyncio.sleep(behaviour.hang_for)
+        if not self._authorised(request):
+            self.stats.unauthorized += 1
+            return web.json_response({"error": "unauthorized"}, status=401)
+        if behaviour.rate_limit_every and count % behaviour.rate_limit_every == 0:
+            self.stats.rate_limited += 1
+            return web.json_response(
+                {"error": "rate limited"},
+                status=429,
+                headers={"Retry-After": str(behaviour.retry_after)},
+            )
+        return None
+
+    async def _sync_get(self, request: web.Request) -> web.Response:
+        """Serve a sync collection or the status counters."""
+        if (early := await self._throttle(request)) is not None:
+            return early
+
+        body = self._bodies.get(request.match_info["endpoint"])
+        if body is None:
+            return web.json_response({"result": []})
+        headers = {"Content-Type": "application/json"}
+        if self.behaviour.gzip:
+            headers["Content-Encoding"] = "gzip"
+        self.stats.bytes_sent += len(body)
+        return web.Response(body=body, headers=headers)
+
+    async def _sync_post(self, request: web.Request) -> web.Response:
+        """Accept a gzipped upload of changed items."""
+        if (early := await self._throttle(request)) is not None:
+            return early
+
+        form = await request.post()
+        upload = form.get("data")
+        json.loads(gzip.decompress(upload.file.read()))
+        self.stats.uploads += 1
+        return web.json_response({"result": True})
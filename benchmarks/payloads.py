@@ -0,0 +1,147 @@
+"""Synthetic Paprika payloads for the Turmeric benchmarks.
+
+The generators are seeded, so every run benchmarks exactly the same data.
+Items carry the full set of fields the Paprika sync API returns, not just
+the ones the integration reads, so decode and memory figures are realistic.
+"""
+import base64
+import gzip
+import json
+import random
+import uuid
+from datetime import date, timedelta
+
+AISLES = [
+    "Produce", "Bakery", "Dairy", "Meat", "Seafood", "Deli", "Frozen",
+    "Canned Goods", "Dry Goods", "Pasta & Rice", "Baking", "Spices",
+    "Condiments", "Snacks", "Beverages", "Breakfast", "International",
+    "Health", "Household", "Pets",
+]
+
+WORDS = [
+    "apple", "banana", "basil", "bean", "beef", "bread", "broccoli", "butter",
+    "carrot", "cheese", "chicken", "chickpea", "cilantro", "coconut", "cream",
+    "cumin", "egg", "flour", "garlic", "ginger", "honey", "lemon", "lentil",
+    "lime", "milk", "mushroom", "noodle", "oat", "olive", "onion", "paprika",
+    "pepper", "pork", "potato", "rice", "salmon", "spinach", "sugar", "tofu",
+    "tomato", "turmeric", "vinegar", "yogurt", "zucchini",
+]
+
+
+def _uid(rng: random.Random) -> str:
+    """Return a Paprika-style upper-case uid."""
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4)).upper()
+
+
+def make_groceries(count: int = 10_000, aisles: int = 60, seed: int = 1) -> dict:
+    """Return a groceries payload with `count` items spread over `aisles` aisles."""
+    rng = random.Random(seed)
+    aisle_names = [
+        AISLES[index % len(AISLES)] + ("" if index < len(AISLES) else f" {index}")
+        for index in range(aisles)
+    ]
+    list_uid = _uid(rng)
+    result = []
+    for _ in range(count):
+        name = " ".join(rng.sample(WORDS, rng.randint(1, 3)))
+        aisle = rng.choice(aisle_names)
+        result.append(
+            {
+                "uid": _uid(rng),
+                "recipe_uid": _uid(rng) if rng.random() < 0.3 else None,
+                "name": name,
+                "order_flag": rng.randint(0, 100),
+                "purchased": rng.random() < 0.2,
+                "aisle": aisle,
+                "ingredient": name,
+                "recipe": None,
+                "instruction": "",
+                "quantity": str(rng.randint(1, 5)),
+                "separate": False,
+                "aisle_uid": _uid(rng),
+                "list_uid": list_uid,
+            }
+        )
+    return {"result": result}
+
+
+def make_grocery_lists(seed: int = 1) -> dict:
+    """Return a grocery lists payload with the list `make_groceries` uses.
+
+    Pass the seed given to `make_groceries` so the uids match.
+    """
+    return {
+        "result": [
+            {
+                "uid": _uid(random.Random(seed)),
+                "name": "My Grocery List",
+                "order_flag": 0,
+                "is_default": True,
+                "reminders_change_id": None,
+            }
+        ]
+    }
+
+
+def make_meals(count: int = 5_000, years: int = 4, seed: int = 2) -> dict:
+    """Return a meals payload with `count` meals over the last `years` years.
+
+    A tenth of the meals fall in the coming weeks, so "upcoming" queries
+    have something to find.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    first = today - timedelta(days=365 * years)
+    span = (today - first).days
+    result = []
+    for index in range(count):
+        if index % 10 == 0:
+            day = today + timedelta(days=rng.randint(0, 21))
+        else:
+            day = first + timedelta(days=rng.randint(0, span))
+        result.append(
+            {
+                "uid": _uid(rng),
+                "recipe_uid": _uid(rng),
+                "date": f"{day.isoformat()} 00:00:00",
+                "type": rng.randint(0, 3),
+                "name": " ".join(rng.sample(WORDS, 3)).title(),
+                "order_flag": 0,
+                "type_uid": None,
+                "scale": None,
+                "is_ingredient": False,
+            }
+        )
+    return {"result": result}
+
+
+def make_status(counter: int = 1) -> dict:
+    """Return a sync status payload with every counter set to `counter`."""
+    return {
+        "result": {
+            name: counter
+            for name in (
+                "groceries", "grocerylists", "meals", "recipes", "mealtypes", "pantry"
+            )
+        }
+    }
+
+
+def load_capture(path: str) -> dict[str, dict]:
+    """Return the last successful GET payload of each endpoint in a capture.
+
+    `path` is an archive written by the integration's record capture mode
+    (`.storage/turmeric/captures/<entry_id>.jsonl`).
+    """
+    payloads = {}
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            endpoint = entry["url"].rstrip("/").rsplit("/", 1)[-1]
+            if entry["method"] == "GET" and entry["status"] == 200:
+                payloads[endpoint] = json.loads(
+                    gzip.decompress(base64.b64decode(entry["body"]))
+                )
+    return payloads
@@ -1,19 +1,40 @@
 """The Turmeric integration."""
 import logging
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+import voluptuous as vol
 
-from .const import DOMAIN, DEFAULT_GROCERIES_REFRESH, DEFAULT_MEALS_REFRESH
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .capture import async_remove_capture
+from .const import (
+    DATA_SCHEDULER,
+    DOMAIN,
+    DEFAULT_GROCERIES_REFRESH,
+    DEFAULT_MEALS_REFRESH,
+)
 from .coordinator import TurmericCoordinator
+from .photos import async_remove_photo_cache
+from .recipes import async_remove_recipe_store
+from .store import TurmericSnapshotStore
+from .views import start_of_today
 
 _LOGGER = logging.getLogger(__name__)
 
-<<<<<<< HEAD
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "calendar", "image", "todo"]
+
+SEARCH_RECIPES_SCHEMA = vol.Schema(
+    {
+        vol.Required("query"): cv.string,
+        vol.Optional("ingredients_only", default=False): cv.boolean,
+        vol.Optional("limit", default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
 
-=======
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Turmeric from a config entry."""
@@ -26,54 +47,169 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data.get("meals_refresh", DEFAULT_MEALS_REFRESH),
     )
 
-    coordinator = TurmericCoordinator(
-        hass, dict(entry.data), groceries_refresh, meals_refresh
-    )
+    coordinator = TurmericCoordinator(hass, entry, groceries_refresh, meals_refresh)
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Initial data fetch so entities have data right away
-    await coordinator.async_config_entry_first_refresh()
-
-    # Forward the entry to the sensor platform
-<<<<<<< HEAD
+    if coordinator.recipes is not None:
+        await coordinator.recipes.async_load()
+    if coordinator.photos is not None:
+        await coordinator.photos.async_load()
+
+    # Bring entities up from the last snapshot and refresh in the background;
+    # only block on the Paprika API when there is nothing on disk yet.
+    if await coordinator.async_load_snapshot():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), "turmeric_initial_refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+
+    # Forward the entry to the entity platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-=======
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
 
     # Register a manual-refresh service for automations / debugging
     async def _handle_refresh(call):
         """Force an immediate refresh of both datasets."""
-<<<<<<< HEAD
         _LOGGER.debug("Manual refresh requested via turmeric.refresh_all service")
-=======
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
-        await coordinator.async_refresh()
+        await coordinator.async_refresh_all()
 
     hass.services.async_register(DOMAIN, "refresh_all", _handle_refresh)
     _LOGGER.debug("Registered turmeric.refresh_all service")
 
+    async def _handle_search_recipes(call: ServiceCall) -> dict:
+        """Search the synced recipes of every Turmeric entry."""
+        return _search_recipes(hass, call)
+
+    if not hass.services.has_service(DOMAIN, "search_recipes"):
+        hass.services.async_register(
+            DOMAIN,
+            "search_recipes",
+            _handle_search_recipes,
+            schema=SEARCH_RECIPES_SCHEMA,
+            supports_response=SupportsResponse.ONLY,
+        )
+        _LOGGER.debug("Registered turmeric.search_recipes service")
+
+    async def _handle_get_lists(call: ServiceCall) -> dict:
+        """Return the full grocery and meal lists of every Turmeric entry."""
+        return _get_lists(hass)
+
+    if not hass.services.has_service(DOMAIN, "get_lists"):
+        hass.services.async_register(
+            DOMAIN,
+            "get_lists",
+            _handle_get_lists,
+            supports_response=SupportsResponse.ONLY,
+        )
+        _LOGGER.debug("Registered turmeric.get_lists service")
+
     # Reload automatically when options change
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
     return True
 
 
+def _search_recipes(hass: HomeAssistant, call: ServiceCall) -> dict:
+    """Run a recipe search across the indexes of all loaded entries."""
+    coordinators = [
+        hass.data[DOMAIN].get(entry.entry_id)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    ]
+    syncs = [
+        coordinator.recipes
+        for coordinator in coordinators
+        if coordinator is not None and coordinator.recipes is not None
+    ]
+    if not syncs:
+        raise HomeAssistantError("Recipe sync is not enabled for any Turmeric entry")
+
+    limit = call.data["limit"]
+    matches = [
+        (matched, score, sync.recipes[uid])
+        for sync in syncs
+        for uid, matched, score in sync.index.search(
+            call.data["query"], limit, call.data["ingredients_only"]
+        )
+    ]
+    matches.sort(key=lambda match: match[:2], reverse=True)
+    return {
+        "recipes": [
+            {
+                "uid": recipe["uid"],
+                "name": recipe.get("name"),
+                "rating": recipe.get("rating"),
+                "source_url": recipe.get("source_url"),
+                "photo_url": recipe.get("photo_url"),
+                "score": round(score, 3),
+            }
+            for _, score, recipe in matches[:limit]
+        ]
+    }
+
+
+def _get_lists(hass: HomeAssistant) -> dict:
+    """Collect the grocery aisles and upcoming meals of all loaded entries."""
+    lists = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        coordinator = hass.data[DOMAIN].get(entry.entry_id)
+        if coordinator is None or not coordinator.data:
+            continue
+        groceries = coordinator.data.get("groceries")
+        grocery_lists = coordinator.data.get("grocerylists")
+        meals = coordinator.data.get("meals")
+        lists.append(
+            {
+                "entry_id": entry.entry_id,
+                "title": entry.title,
+                "aisles": groceries.default.aisles if groceries is not None else {},
+                "grocery_lists": [
+                    {
+                        "uid": list_uid,
+                        "name": record.name,
+                        "aisles": groceries.lists[list_uid].aisles
+                        if groceries is not None and list_uid in groceries.lists
+                        else {},
+                    }
+                    for list_uid, record in grocery_lists.items.items()
+                ]
+                if grocery_lists is not None
+                else [],
+                "meals": meals.upcoming(start_of_today()) if meals is not None else [],
+            }
+        )
+    return {"lists": lists}
+
+
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the integration when the user changes options."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is not None and coordinator.options == dict(entry.options):
+        # Only entry data changed (e.g. a renewed API token); nothing to reload.
+        return
     _LOGGER.debug("Turmeric options updated – reloading entry")
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the on-disk snapshot, recipes and photos when the entry is removed."""
+    await TurmericSnapshotStore(hass, entry.entry_id).async_remove()
+    await async_remove_recipe_store(hass, entry.entry_id)
+    await async_remove_photo_cache(hass, entry.entry_id)
+    await async_remove_capture(hass, entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload the Turmeric config entry."""
+    # Upload queued grocery edits while the shared scheduler still runs
+    await hass.data[DOMAIN][entry.entry_id].writer.async_shutdown()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
-<<<<<<< HEAD
+        if not any(key != DATA_SCHEDULER for key in hass.data[DOMAIN]):
+            # Last entry gone: stop the shared scheduler's timer
+            scheduler = hass.data[DOMAIN].pop(DATA_SCHEDULER, None)
+            if scheduler is not None:
+                scheduler.async_shutdown()
         _LOGGER.debug("Turmeric integration unloaded")
     return unload_ok
-=======
-    return unload_ok
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
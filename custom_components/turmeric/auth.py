@@ -0,0 +1,229 @@
+"""Bearer token management for the Turmeric integration."""
+import asyncio
+import base64
+import json
+import logging
+import math
+from datetime import datetime, timedelta
+
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .capture import TurmericCaptureSession
+from .config_flow import async_login_paprika
+from .const import CAPTURE_REPLAY, TOKEN_MAX_AGE, TOKEN_RENEW_MARGIN
+from .scheduler import async_get_scheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _token_claims(token: str) -> dict:
+    """Return the claims of a JWT, or an empty dict for other tokens."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return {}
+    try:
+        claims = json.loads(
+            base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+        )
+    except ValueError:
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
+
+def _token_time(token: str, claim: str) -> datetime | None:
+    """Return a timestamp claim (`exp`, `iat`) of a JWT, if it has one."""
+    value = _token_claims(token).get(claim)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return dt_util.utc_from_timestamp(value)
+    return None
+
+
+def _token_expiry(token: str, issued_at: datetime | None) -> datetime | None:
+    """Return when `token` expires, or None if that cannot be determined.
+
+    Paprika v2 tokens are JWTs, so the `exp` claim is used when present.
+    Otherwise the token is assumed to live for TOKEN_MAX_AGE hours.
+    """
+    expires_at = _token_time(token, "exp")
+    if expires_at is not None:
+        return expires_at
+
+    if issued_at is not None:
+        return issued_at + timedelta(hours=TOKEN_MAX_AGE)
+    return None
+
+
+def _renewal_time(
+    issued_at: datetime | None, expires_at: datetime | None
+) -> datetime | None:
+    """Return when a token should be renewed ahead of its expiry, or None.
+
+    Tokens are renewed TOKEN_RENEW_MARGIN minutes before they expire, but
+    never before half of their lifetime has passed.  A token that lives no
+    longer than the margin is not renewed ahead at all; it is replaced once
+    it has expired or is rejected with a 401.
+    """
+    if expires_at is None:
+        return None
+    margin = timedelta(minutes=TOKEN_RENEW_MARGIN)
+    if issued_at is None:
+        return expires_at - margin
+    lifetime = expires_at - issued_at
+    if lifetime <= margin:
+        return None
+    return max(expires_at - margin, issued_at + lifetime / 2)
+
+
+class TurmericTokenManager:
+    """Own the Paprika bearer token for a config entry.
+
+    Concurrent callers that hit a 401 share a single in-flight login, the
+    refreshed token is written back to the config entry so it survives
+    restarts, and the token is renewed shortly before it expires so requests
+    do not have to pay for a 401 round trip first.
+    """
+
+    def __init__(self, hass, entry, session=None) -> None:
+        """Initialise the token manager from the stored entry data.
+
+        Logins go through `session` when given, else HA's shared session.
+        """
+        self.hass = hass
+        self.entry = entry
+        self._session = session
+        # Replayed logins carry a redacted placeholder token, which must not
+        # replace the real one stored in the entry.
+        self._persist = not (
+            isinstance(session, TurmericCaptureSession)
+            and session.mode == CAPTURE_REPLAY
+        )
+        self._token: str = entry.data.get("api_token", "")
+        issued_at = entry.data.get("token_issued_at")
+        self._issued_at = (
+            dt_util.parse_datetime(issued_at)
+            if issued_at
+            else _token_time(self._token, "iat")
+        )
+        self._expires_at = _token_expiry(self._token, self._issued_at)
+        self._renew_at = _renewal_time(self._issued_at, self._expires_at)
+        now = dt_util.utcnow()
+        if (
+            self._renew_at is not None
+            and self._renew_at <= now
+            and self._expires_at is not None
+            and now < self._expires_at
+        ):
+            # The stored token is still valid; use it until it expires
+            # rather than logging in again right at startup.
+            self._renew_at = None
+        self._refresh_task: asyncio.Task | None = None
+        self._unsub_renew = None
+
+        entry.async_on_unload(self._async_cancel_renewal)
+        self._async_schedule_renewal()
+
+    @property
+    def token(self) -> str:
+        """Return the current bearer token."""
+        return self._token
+
+    async def async_get_token(self) -> str:
+        """Return a usable token, renewing it first if it is about to expire."""
+        if self._expires_at is not None:
+            now = dt_util.utcnow()
+            if now >= self._expires_at or (
+                self._renew_at is not None and now >= self._renew_at
+            ):
+                await self.async_refresh_token(self._token)
+        return self._token
+
+    async def async_refresh_token(self, stale_token: str) -> bool:
+        """Replace `stale_token` with a fresh one.
+
+        If another caller already replaced it, or a login is in flight, no
+        additional login is made.
+        """
+        if self._token and self._token != stale_token:
+            return True
+
+        if self._refresh_task is None:
+            self._refresh_task = self.hass.async_create_task(
+                self._async_login(), "turmeric_token_refresh"
+            )
+        task = self._refresh_task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done() and self._refresh_task is task:
+                self._refresh_task = None
+
+    async def _async_login(self) -> bool:
+        """Log in with the stored credentials and persist the new token."""
+        email = self.entry.data.get(CONF_EMAIL, "")
+        password = self.entry.data.get(CONF_PASSWORD, "")
+        if not email or not password:
+            _LOGGER.error("Missing email or password for re-authentication")
+            return False
+
+        # Every request of this entry is waiting on the login, so it jumps
+        # the shared request queue.
+        await async_get_scheduler(self.hass).async_acquire(math.inf)
+        session = self._session or async_get_clientsession(self.hass)
+        token = await async_login_paprika(session, email, password)
+        if not token:
+            _LOGGER.error(
+                "Re-authentication failed: Invalid token returned from Paprika API"
+            )
+            return False
+
+        issued_at = dt_util.utcnow()
+        self._token = token
+        self._issued_at = issued_at
+        self._expires_at = _token_expiry(token, issued_at)
+        if self._expires_at is not None and self._expires_at <= issued_at:
+            # Clock skew or a bogus claim; rely on 401s rather than
+            # logging in again on every request.
+            _LOGGER.debug("New token is already past its expiry claim, ignoring it")
+            self._expires_at = None
+        self._renew_at = _renewal_time(issued_at, self._expires_at)
+        if self._persist:
+            self.hass.config_entries.async_update_entry(
+                self.entry,
+                data={
+                    **self.entry.data,
+                    "api_token": token,
+                    "token_issued_at": issued_at.isoformat(),
+                },
+            )
+        self._async_schedule_renewal()
+        _LOGGER.debug(
+            "Successfully re-authenticated with Paprika API (expires %s)",
+            self._expires_at,
+        )
+        return True
+
+    @callback
+    def _async_schedule_renewal(self) -> None:
+        """Schedule a background renewal ahead of the token's expiry."""
+        self._async_cancel_renewal()
+        if self._renew_at is None:
+            return
+        self._unsub_renew = async_track_point_in_utc_time(
+            self.hass, self._async_scheduled_renewal, self._renew_at
+        )
+
+    async def _async_scheduled_renewal(self, _now: datetime) -> None:
+        """Renew the token from the scheduled timer."""
+        self._unsub_renew = None
+        await self.async_refresh_token(self._token)
+
+    @callback
+    def _async_cancel_renewal(self) -> None:
+        """Cancel the pending renewal timer, if any."""
+        if self._unsub_renew is not None:
+            self._unsub_renew()
+            self._unsub_renew = None
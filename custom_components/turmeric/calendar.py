@@ -0,0 +1,75 @@
+"""Calendar platform for Turmeric integration."""
+from datetime import datetime, time, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .views import MealEntry
+
+
+class TurmericMealCalendar(CoordinatorEntity, CalendarEntity):
+    """Paprika meal plan as an all-day event per meal."""
+
+    def __init__(self, coordinator, entry_id):
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+
+    @property
+    def name(self):
+        """Return the name of the calendar."""
+        return "Turmeric Meals"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID for the calendar."""
+        return f"turmeric_meals_calendar_{self._entry_id}"
+
+    @property
+    def available(self):
+        """Return True if the meal plan was last polled successfully."""
+        return self.coordinator.collections["meals"].available
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return today's first meal, or the next planned one."""
+        view = self.coordinator.data and self.coordinator.data.get("meals")
+        if view is None:
+            return None
+        meals = view.next_from_day(dt_util.now().date(), 1)
+        return _to_event(meals[0]) if meals else None
+
+    async def async_get_events(
+        self, hass, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return meals whose day overlaps [start_date, end_date)."""
+        view = self.coordinator.data and self.coordinator.data.get("meals")
+        if view is None:
+            return []
+
+        end_local = dt_util.as_local(end_date)
+        last_day = end_local.date()
+        if end_local.time() != time.min:
+            last_day += timedelta(days=1)
+        return [
+            _to_event(meal)
+            for meal in view.between_days(dt_util.as_local(start_date).date(), last_day)
+        ]
+
+
+def _to_event(meal: MealEntry) -> CalendarEvent:
+    """Build an all-day calendar event from a meal index entry."""
+    day = meal.when.date()
+    return CalendarEvent(
+        start=day,
+        end=day + timedelta(days=1),
+        summary=f"{meal.attrs['type']}: {meal.attrs['name']}",
+    )
+
+
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    """Set up the Turmeric meal calendar based on a config entry."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities([TurmericMealCalendar(coordinator, config_entry.entry_id)])
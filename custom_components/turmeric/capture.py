@@ -0,0 +1,224 @@
+"""Record and replay Paprika HTTP exchanges for offline reproduction."""
+import asyncio
+import base64
+import gzip
+import json
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import CAPTURE_RECORD, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Response headers that are never written to an archive
+_DROPPED_HEADERS = {"set-cookie"}
+
+# Fields of POST responses (logins) replaced before they are written, and
+# the value written instead
+_REDACTED_FIELDS = {"token", "api_token", "email", "password"}
+_REDACTED = "**REDACTED**"
+
+
+def _capture_path(hass, entry_id: str) -> Path:
+    """Return the capture archive of a config entry."""
+    return Path(hass.config.path(STORAGE_DIR, DOMAIN, "captures", f"{entry_id}.jsonl"))
+
+
+async def async_remove_capture(hass, entry_id: str) -> None:
+    """Delete the capture archive of a config entry."""
+    await hass.async_add_executor_job(
+        lambda: _capture_path(hass, entry_id).unlink(missing_ok=True)
+    )
+
+
+def _redact(value):
+    """Return `value` with every _REDACTED_FIELDS entry replaced."""
+    if isinstance(value, dict):
+        return {
+            key: _REDACTED if key in _REDACTED_FIELDS else _redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
+
+
+def _redact_body(body: bytes) -> bytes:
+    """Return a JSON body with tokens and credentials replaced."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    return json.dumps(_redact(data)).encode()
+
+
+def _read_archive(path: Path) -> list[dict]:
+    """Return the exchanges recorded in an archive, oldest first."""
+    try:
+        with path.open(encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+class _CapturedResponse:
+    """The parts of an aiohttp response read by Turmeric, held in memory."""
+
+    def __init__(self, method: str, url: str, status: int, headers, body: bytes) -> None:
+        """Initialise the response from a recorded or live exchange."""
+        self.method = method
+        self.url = URL(url)
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self._body = body
+
+    async def read(self) -> bytes:
+        """Return the response body."""
+        return self._body
+
+    async def json(self):
+        """Return the decoded JSON body."""
+        return json.loads(self._body)
+
+    def raise_for_status(self) -> None:
+        """Raise ClientResponseError for 4xx and 5xx statuses, like aiohttp."""
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(self.url, self.method, CIMultiDictProxy(CIMultiDict())),
+                (),
+                status=self.status,
+                message=f"recorded status {self.status}",
+                headers=self.headers,
+            )
+
+
+class TurmericCaptureSession:
+    """Drop-in for the parts of aiohttp.ClientSession Turmeric uses.
+
+    In record mode every exchange goes to Paprika as usual, and the response
+    status, headers, gzipped body and elapsed time are appended to a JSONL
+    archive.  Request bodies are never written, and tokens and credentials
+    in POST responses (the login) are redacted, so an archive can be shared
+    in a bug report.  The archive is started over each time the entry is
+    set up.  In replay mode responses are served from the archive in
+    recorded order for each method and URL, after the recorded delay,
+    without any network access; once a URL's recordings run out its last
+    one is repeated.
+    """
+
+    def __init__(self, hass, entry_id: str, mode: str, session) -> None:
+        """Initialise the capture session in `mode` (record or replay)."""
+        self.hass = hass
+        self.mode = mode
+        self.exchanges = 0
+        self._session = session
+        self._path = _capture_path(hass, entry_id)
+        self._lock = asyncio.Lock()
+        self._started = time.monotonic()
+        self._truncate = True
+        self._replay: dict[tuple[str, str], deque] | None = None
+
+    def get(self, url: str, **kwargs):
+        """Perform (or replay) a GET request."""
+        return self._async_exchange("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        """Perform (or replay) a POST request."""
+        return self._async_exchange("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def _async_exchange(self, method: str, url: str, **kwargs):
+        """Yield the response to one exchange, recording or replaying it."""
+        if self.mode == CAPTURE_RECORD:
+            response = await self._async_record(method, url, **kwargs)
+        else:
+            response = await self._async_replay(method, url)
+        self.exchanges += 1
+        yield response
+
+    async def _async_record(self, method: str, url: str, **kwargs) -> _CapturedResponse:
+        """Send the request to Paprika and append the exchange to the archive."""
+        started = time.monotonic()
+        async with self._session.request(method, url, **kwargs) as resp:
+            body = await resp.read()
+            status = resp.status
+            headers = [
+                (key, value)
+                for key, value in resp.headers.items()
+                if key.lower() not in _DROPPED_HEADERS
+            ]
+        elapsed = time.monotonic() - started
+
+        exchange = {
+            "method": method,
+            "url": url,
+            "status": status,
+            "headers": headers,
+            "elapsed": round(elapsed, 4),
+            "offset": round(started - self._started, 4),
+        }
+        async with self._lock:
+            truncate, self._truncate = self._truncate, False
+            await self.hass.async_add_executor_job(
+                self._write, exchange, body, truncate
+            )
+        return _CapturedResponse(method, url, status, headers, body)
+
+    def _write(self, exchange: dict, body: bytes, truncate: bool) -> None:
+        """Append one exchange to the archive, starting it over if asked.
+
+        Runs in the executor: redacting, compressing and encoding a large
+        body would otherwise block the event loop.
+        """
+        # The live caller gets the real body; only the archive is redacted.
+        # Sync GETs carry no credentials, and skipping them keeps large
+        # lists from being decoded twice.
+        if exchange["method"] == "POST":
+            body = _redact_body(body)
+        line = json.dumps(
+            {**exchange, "body": base64.b64encode(gzip.compress(body)).decode("ascii")},
+            separators=(",", ":"),
+        )
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("w" if truncate else "a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+    async def _async_replay(self, method: str, url: str) -> _CapturedResponse:
+        """Serve the next recorded response for `method` and `url`."""
+        async with self._lock:
+            if self._replay is None:
+                self._replay = {}
+                entries = await self.hass.async_add_executor_job(
+                    _read_archive, self._path
+                )
+                for entry in entries:
+                    self._replay.setdefault(
+                        (entry["method"], entry["url"]), deque()
+                    ).append(entry)
+                _LOGGER.debug(
+                    "Loaded %d recorded exchanges from %s", len(entries), self._path
+                )
+
+        recorded = self._replay.get((method, url))
+        if not recorded:
+            raise aiohttp.ClientConnectionError(
+                f"No recorded response for {method} {url}"
+            )
+        entry = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        await asyncio.sleep(entry["elapsed"])
+        return _CapturedResponse(
+            method,
+            url,
+            entry["status"],
+            entry["headers"],
+            gzip.decompress(base64.b64decode(entry["body"])),
+        )
@@ -1,8 +1,5 @@
 """Config flow for Turmeric integration."""
-<<<<<<< HEAD
 import asyncio
-=======
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
 import logging
 
 import aiohttp
@@ -12,12 +9,9 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
 
-<<<<<<< HEAD
 from .const import DOMAIN, LOGIN_URL_V2, LOGIN_URL_V1, API_TIMEOUT
-=======
-from .const import DOMAIN, LOGIN_URL_V2, LOGIN_URL_V1
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,7 +19,6 @@ _LOGGER = logging.getLogger(__name__)
 async def async_login_paprika(
     session: aiohttp.ClientSession, email: str, password: str
 ) -> str | None:
-<<<<<<< HEAD
     """Authenticate with Paprika and return the bearer token, or None on failure.
     
     Tries API v2 first, falls back to v1 for backwards compatibility.
@@ -37,19 +30,11 @@ async def async_login_paprika(
                 url,
                 data={"email": email, "password": password},
                 timeout=aiohttp.ClientTimeout(total=API_TIMEOUT),
-=======
-    """Authenticate with Paprika and return the bearer token, or None on failure."""
-    for url in (LOGIN_URL_V2, LOGIN_URL_V1):
-        try:
-            async with session.post(
-                url, data={"email": email, "password": password}, timeout=aiohttp.ClientTimeout(total=10)
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
             ) as resp:
                 if resp.status == 200:
                     data = await resp.json()
                     token = data.get("result", {}).get("token")
                     if token:
-<<<<<<< HEAD
                         _LOGGER.debug("Successfully authenticated with Paprika API %s", url_name)
                         return token
                     _LOGGER.warning(
@@ -69,11 +54,6 @@ async def async_login_paprika(
             _LOGGER.warning("Unexpected error with Paprika API %s: %s", url_name, err)
 
     _LOGGER.error("Failed to authenticate with Paprika API (tried v2 and v1)")
-=======
-                        return token
-        except (aiohttp.ClientError, TimeoutError):
-            continue
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
     return None
 
 
@@ -87,19 +67,12 @@ class TurmericConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-<<<<<<< HEAD
             email = user_input[CONF_EMAIL].strip()
-=======
-            email = user_input[CONF_EMAIL]
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
             password = user_input[CONF_PASSWORD]
             groceries_refresh = user_input.get("groceries_refresh", 360)
             meals_refresh = user_input.get("meals_refresh", 720)
 
-<<<<<<< HEAD
             # Validate refresh intervals
-=======
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
             if not (1 <= groceries_refresh <= 1440) or not (1 <= meals_refresh <= 1440):
                 errors["base"] = "invalid_refresh_time"
             else:
@@ -113,16 +86,14 @@ class TurmericConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 if token is None:
                     errors["base"] = "invalid_auth"
                 else:
-<<<<<<< HEAD
                     _LOGGER.info("Turmeric integration setup successful for %s", email)
-=======
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
                     return self.async_create_entry(
                         title=email,
                         data={
                             CONF_EMAIL: email,
                             CONF_PASSWORD: password,
                             "api_token": token,
+                            "token_issued_at": dt_util.utcnow().isoformat(),
                             "groceries_refresh": groceries_refresh,
                             "meals_refresh": meals_refresh,
                         },
@@ -149,9 +120,5 @@ class TurmericConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def async_get_options_flow(config_entry):
         """Return the options flow handler."""
         from .options_flow import TurmericOptionsFlowHandler
-<<<<<<< HEAD
 
         return TurmericOptionsFlowHandler(config_entry)
-=======
-        return TurmericOptionsFlowHandler(config_entry)
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
@@ -1,4 +1,3 @@
-<<<<<<< HEAD
 """Constants for the Turmeric integration."""
 
 DOMAIN = "turmeric"
@@ -8,13 +7,112 @@ BASE_URL = "https://www.paprikaapp.com/api/v2/sync"
 LOGIN_URL_V2 = "https://www.paprikaapp.com/api/v2/account/login/"
 LOGIN_URL_V1 = "https://www.paprikaapp.com/api/v1/account/login/"
 
+# Sync status endpoint (relative to BASE_URL) – returns a change counter
+# per collection that increments whenever the collection is modified.
+STATUS_ENDPOINT = "status"
+
+# Recipe catalogue endpoints (relative to BASE_URL): the listing returns
+# uid/hash pairs, individual recipes live under recipe/<uid>
+RECIPES_ENDPOINT = "recipes"
+RECIPE_ENDPOINT = "recipe"
+
 # Default refresh intervals (minutes)
 DEFAULT_GROCERIES_REFRESH = 360  # 6 hours
 DEFAULT_MEALS_REFRESH = 720  # 12 hours
 
+# Adaptive polling: shortest poll interval (minutes), interval growth per
+# poll without changes, weight of the newest gap when smoothing the time
+# between changes, and the window around active times (minutes)
+ADAPTIVE_MIN_INTERVAL = 2
+ADAPTIVE_BACKOFF = 1.5
+ADAPTIVE_CHANGE_SMOOTHING = 0.3
+ADAPTIVE_ACTIVE_WINDOW = 30
+
+# Lower bound on the coordinator's wake-up interval (minutes)
+MIN_POLL_INTERVAL = 1
+
+# On-disk snapshot of the last good payloads
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10  # seconds
+
+# Token lifetime assumed when the token carries no expiry (hours), and how
+# long before expiry it is renewed (minutes)
+TOKEN_MAX_AGE = 24
+TOKEN_RENEW_MARGIN = 10
+
+# Recipe sync: store version, write delay (seconds), parallel downloads,
+# fallback interval when the status endpoint is unavailable (minutes), and
+# the recipe fields kept locally
+RECIPES_VERSION = 1
+RECIPES_SAVE_DELAY = 30
+RECIPE_FETCH_CONCURRENCY = 4
+DEFAULT_RECIPES_REFRESH = 1440  # 24 hours
+RECIPE_FIELDS = (
+    "name",
+    "ingredients",
+    "directions",
+    "description",
+    "notes",
+    "categories",
+    "servings",
+    "prep_time",
+    "cook_time",
+    "total_time",
+    "rating",
+    "source",
+    "source_url",
+    "photo_url",
+    "image_url",
+    "in_trash",
+)
+
+# Relative weight of each recipe field in full-text search
+RECIPE_SEARCH_WEIGHTS = {
+    "name": 3.0,
+    "ingredients": 2.0,
+    "description": 1.0,
+    "notes": 0.5,
+    "directions": 0.5,
+}
+
+# Recipe photo cache: total size budget, largest accepted photo and the
+# chunk size used when streaming downloads to disk (bytes)
+PHOTO_CACHE_MAX_BYTES = 100 * 1024 * 1024
+PHOTO_MAX_BYTES = 10 * 1024 * 1024
+PHOTO_CHUNK_SIZE = 64 * 1024
+
+# Shared request scheduler: sustained requests per second across every
+# config entry, burst size, and retry backoff base (seconds) and jitter
+DATA_SCHEDULER = "scheduler"
+API_RATE_LIMIT = 0.5
+API_BURST = 5
+RETRY_BASE_DELAY = 1
+RETRY_JITTER = 0.25
+
+# Developer capture mode: exchanges with Paprika are recorded to, or
+# replayed from, a JSONL archive per config entry
+CAPTURE_OFF = "off"
+CAPTURE_RECORD = "record"
+CAPTURE_REPLAY = "replay"
+CAPTURE_MODES = [CAPTURE_OFF, CAPTURE_RECORD, CAPTURE_REPLAY]
+
 # API request timeout (seconds)
 API_TIMEOUT = 10
 
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Events fired for list changes
+EVENT_GROCERY_ADDED = f"{DOMAIN}_grocery_added"
+EVENT_GROCERY_REMOVED = f"{DOMAIN}_grocery_removed"
+EVENT_GROCERY_CHECKED = f"{DOMAIN}_grocery_checked"
+EVENT_MEAL_CHANGED = f"{DOMAIN}_meal_changed"
+
+# Grocery write-back: batching window and longest retry delay (seconds)
+GROCERIES_ENDPOINT = "groceries"
+WRITEBACK_DELAY = 5
+WRITEBACK_MAX_RETRY_DELAY = 300
+
 # Meal type mapping
 MEAL_TYPES = {
     0: "Breakfast",
@@ -23,19 +121,15 @@ MEAL_TYPES = {
     3: "Snack",
 }
 
+# Meal type used when Paprika omits it, and the date format of meal entries
+DEFAULT_MEAL_TYPE = 2
+MEAL_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Number of upcoming meals shown by the meals sensor
+UPCOMING_MEALS = 7
+
 # Expected response fields
 GROCERY_REQUIRED_FIELDS = ["name"]
 GROCERY_OPTIONAL_FIELDS = ["aisle"]
 MEAL_REQUIRED_FIELDS = ["name", "date"]
 MEAL_OPTIONAL_FIELDS = ["type"]
-=======
-# const.py
-DOMAIN = "turmeric"
-BASE_URL = "https://www.paprikaapp.com/api/v2/sync"
-LOGIN_URL_V2 = "https://www.paprikaapp.com/api/v2/account/login/"
-LOGIN_URL_V1 = "https://www.paprikaapp.com/api/v1/account/login/"
-
-# Default refresh intervals (minutes)
-DEFAULT_GROCERIES_REFRESH = 360  # 6 hours
-DEFAULT_MEALS_REFRESH = 720  # 12 hours
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
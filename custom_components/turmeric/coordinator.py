@@ -1,110 +1,468 @@
 """Data update coordinator for Turmeric integration."""
 import asyncio
+import gzip
+import hashlib
+import json
 import logging
+import math
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import aiohttp
 
-from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
 
-<<<<<<< HEAD
 from .const import (
     BASE_URL,
-    DEFAULT_GROCERIES_REFRESH,
-    DEFAULT_MEALS_REFRESH,
     API_TIMEOUT,
     GROCERY_REQUIRED_FIELDS,
     MEAL_REQUIRED_FIELDS,
+    CAPTURE_OFF,
+    STATUS_ENDPOINT,
+    RECIPES_ENDPOINT,
+    RECIPE_ENDPOINT,
+    DEFAULT_RECIPES_REFRESH,
+    MIN_POLL_INTERVAL,
 )
-=======
-from .const import BASE_URL, DEFAULT_GROCERIES_REFRESH, DEFAULT_MEALS_REFRESH
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
+from .auth import TurmericTokenManager
+from .capture import TurmericCaptureSession
+from .events import DIFF_EVENTS
+from .metrics import TurmericMetrics
+from .parser import ParseResult, parse_collection
+from .photos import TurmericPhotoCache
+from .polling import AdaptivePoller, parse_active_times
+from .recipes import TurmericRecipeSync
+from .scheduler import async_get_scheduler, backoff_delay, parse_retry_after
+from .store import TurmericSnapshotStore
+from .views import GroceryListsView, GroceryView, MealView, start_of_today
+from .writeback import TurmericGroceryWriter
 
 _LOGGER = logging.getLogger(__name__)
 
+VIEW_TYPES = {
+    "groceries": GroceryView,
+    "meals": MealView,
+    "grocerylists": GroceryListsView,
+}
+
+
+@dataclass
+class CollectionState:
+    """Sync, retry and availability state of one Paprika collection.
+
+    Collections are polled, fetched and retried independently, so one slow
+    or failing endpoint neither stalls nor invalidates the others.  Only the
+    parsed records are kept; the decoded JSON is dropped after parsing.
+    """
+
+    name: str
+    poller: AdaptivePoller
+    records: list | None = None
+    view: Any = None
+    synced_counter: int | None = None
+    last_synced: datetime | None = None
+    failures: int = 0
+    last_error: str | None = None
+    quarantined: int = 0  # malformed items skipped in the current records
+    etag: str | None = None
+    digest: str | None = None  # sha256 of the raw body behind `records`
+
+    @property
+    def available(self) -> bool:
+        """Return True if there is data and the last poll succeeded."""
+        return self.view is not None and not self.failures
+
 
 class TurmericCoordinator(DataUpdateCoordinator):
     """Custom coordinator for Turmeric integration."""
 
-    def __init__(self, hass, entry_data, groceries_refresh, meals_refresh):
+    def __init__(self, hass, entry, groceries_refresh, meals_refresh):
         """Initialise the coordinator.
 
-        `groceries_refresh` and `meals_refresh` are in minutes.
-        The coordinator runs at the shortest interval and decides
-        internally whether each endpoint needs to be refreshed.
+        `groceries_refresh` and `meals_refresh` are in minutes and cap how
+        long each collection may go unpolled.  Each collection has its own
+        adaptive poller and retry state, and the coordinator wakes up
+        whenever the next one is due.
         """
-        min_interval = min(groceries_refresh, meals_refresh)
+        self.entry = entry
+        self.options = dict(entry.options)
+        self.collections = {
+            "groceries": CollectionState(
+                "groceries",
+                AdaptivePoller(
+                    timedelta(minutes=groceries_refresh),
+                    parse_active_times(self.options.get("shopping_times")),
+                ),
+            ),
+            "meals": CollectionState(
+                "meals",
+                AdaptivePoller(
+                    timedelta(minutes=meals_refresh),
+                    parse_active_times(self.options.get("meal_times")),
+                ),
+            ),
+            # Names and order of the grocery lists the items are partitioned by
+            "grocerylists": CollectionState(
+                "grocerylists",
+                AdaptivePoller(
+                    timedelta(minutes=groceries_refresh),
+                    parse_active_times(self.options.get("shopping_times")),
+                ),
+            ),
+        }
 
         super().__init__(
             hass,
             _LOGGER,
             name="TurmericCoordinator",
-            update_interval=timedelta(minutes=min_interval),
+            # Unchanged collections keep their view objects, so the data
+            # compares equal and entities are not written again.
+            always_update=False,
+            update_interval=min(
+                state.poller.floor for state in self.collections.values()
+            ),
         )
 
-        self._entry_data = entry_data
-        self.api_token: str = entry_data.get("api_token", "")
-        self.groceries_refresh = timedelta(minutes=groceries_refresh)
-        self.meals_refresh = timedelta(minutes=meals_refresh)
+        # Developer capture mode records every Paprika exchange of this
+        # entry, or replays a recording instead of using the network.
+        capture_mode = self.options.get("capture_mode", CAPTURE_OFF)
+        self.session = async_get_clientsession(hass)
+        if capture_mode != CAPTURE_OFF:
+            _LOGGER.warning(
+                "Turmeric capture mode is %s for %s", capture_mode, entry.title
+            )
+            self.session = TurmericCaptureSession(
+                hass, entry.entry_id, capture_mode, self.session
+            )
+
+        self.token_manager = TurmericTokenManager(hass, entry, self.session)
+        self.scheduler = async_get_scheduler(hass)
+        self.metrics = TurmericMetrics()
+        # Flushed by async_unload_entry while the scheduler is still running
+        self.writer = TurmericGroceryWriter(self)
+
+        # Start of the local day the upcoming-meal window is sliced from.
+        # It moves at local midnight without polling Paprika.
+        self.today = start_of_today()
+        entry.async_on_unload(
+            async_track_time_change(
+                hass, self._async_day_rollover, hour=0, minute=0, second=0
+            )
+        )
+
+        # Change counters reported by the latest sync status poll
+        self._remote_counters: dict[str, int] = {}
+
+        self._snapshot = TurmericSnapshotStore(hass, entry.entry_id)
 
-        self.last_groceries_update: datetime = datetime.min.replace(tzinfo=timezone.utc)
-        self.last_meals_update: datetime = datetime.min.replace(tzinfo=timezone.utc)
+        # Recipe catalogue sync is opt-in: the first sync of a large
+        # catalogue downloads every recipe once.
+        self.recipes: TurmericRecipeSync | None = (
+            TurmericRecipeSync(self) if self.options.get("sync_recipes") else None
+        )
+        self.photos: TurmericPhotoCache | None = (
+            TurmericPhotoCache(hass, entry.entry_id) if self.recipes is not None else None
+        )
+        self.last_recipes_sync: datetime = datetime.min.replace(tzinfo=timezone.utc)
 
-        self.groceries_data = None
-        self.meals_data = None
+    async def async_load_snapshot(self) -> bool:
+        """Seed the coordinator from the on-disk snapshot.
 
-    async def _async_re_authenticate(self) -> bool:
-        """Re-authenticate with Paprika using stored credentials."""
-        from .config_flow import async_login_paprika
+        Returns True if usable data was loaded.  The snapshot's sync counters
+        are restored too, so the first network refresh only downloads the
+        collections that changed while Home Assistant was down.
+        """
+        snapshot = await self._snapshot.async_load()
+        if snapshot is None:
+            return False
 
-        email = self._entry_data.get(CONF_EMAIL, "")
-        password = self._entry_data.get(CONF_PASSWORD, "")
-        if not email or not password:
-<<<<<<< HEAD
-            _LOGGER.error("Missing email or password for re-authentication")
-=======
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
+        loaded = False
+        for name, state in self.collections.items():
+            payload = snapshot["collections"].get(name)
+            if payload is None:
+                continue
+            try:
+                self._set_records(state, self._parse(state, payload))
+            except (KeyError, TypeError, UpdateFailed) as err:
+                _LOGGER.warning("Ignoring unusable %s snapshot: %s", name, err)
+                continue
+            state.synced_counter = snapshot["counters"].get(name)
+            loaded = True
+        if not loaded:
             return False
 
-        session = async_get_clientsession(self.hass)
-        token = await async_login_paprika(session, email, password)
-        if token:
-            self.api_token = token
-<<<<<<< HEAD
-            _LOGGER.debug("Successfully re-authenticated with Paprika API")
-            return True
+        _LOGGER.debug(
+            "Loaded Turmeric snapshot saved at %s (counters: %s)",
+            snapshot["saved_at"],
+            snapshot["counters"],
+        )
+        self.async_set_updated_data(self._build_data())
+        return True
 
-        _LOGGER.error("Re-authentication failed: Invalid token returned from Paprika API")
-=======
-            return True
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
-        return False
+    def _parse(self, state: CollectionState, payload: dict) -> ParseResult:
+        """Parse a collection payload into records."""
+        parsed = parse_collection(state.name, payload["result"])
+        if payload["result"] and not parsed.records:
+            # Nothing usable: keep the current data and fetch the body again
+            state.digest = state.etag = None
+            raise UpdateFailed(f"Every {state.name} item was malformed")
+        return parsed
+
+    def _set_records(self, state: CollectionState, parsed: ParseResult) -> None:
+        """Store a collection's records and rebuild its view."""
+        state.records = parsed.records
+        state.quarantined = parsed.quarantined
+        self._build_view(state)
+        if state.name == "grocerylists" and self.collections["groceries"].records is not None:
+            # The default list may have changed
+            self._build_view(self.collections["groceries"])
+
+    def _build_view(self, state: CollectionState) -> None:
+        """Rebuild a collection's view from its records.
+
+        Grocery edits that Paprika has not confirmed yet are overlaid on the
+        view, so a poll never briefly reverts them.  The items that differ
+        from the previous view are announced as events; nothing is fired
+        for the first view (e.g. one restored from the snapshot).
+        """
+        records = state.records or []
+        previous = state.view
+        if state.name == "groceries":
+            lists = self.collections["grocerylists"].view
+            state.view = GroceryView(
+                self.writer.overlay(records),
+                lists.default_uid if lists is not None else None,
+                previous,
+            )
+        else:
+            state.view = VIEW_TYPES[state.name](records)
+
+        diff_events = DIFF_EVENTS.get(state.name)
+        if previous is not None and diff_events is not None:
+            for event_type, data in diff_events(previous.items, state.view.items):
+                self.hass.bus.async_fire(
+                    event_type, {"entry_id": self.entry.entry_id, **data}
+                )
+
+    @callback
+    def async_apply_local_changes(self) -> None:
+        """Show queued grocery edits without waiting for the next poll."""
+        self._build_view(self.collections["groceries"])
+        self.data = self._build_data()
+        self.async_update_listeners()
+
+    @callback
+    def _async_day_rollover(self, _now: datetime) -> None:
+        """Re-slice the fetched meals for the new day and update entities."""
+        today = start_of_today()
+        if today == self.today:
+            return
+        self.today = today
+        _LOGGER.debug("Rolling meal window over to %s", today.date())
+        self.async_update_listeners()
+
+    def _build_data(self) -> dict:
+        """Return the coordinator data handed to entities."""
+        return {name: state.view for name, state in self.collections.items()}
+
+    def _async_schedule_snapshot(self) -> None:
+        """Persist the current records after a short delay."""
+        self._snapshot.async_schedule_save(
+            {name: state.records for name, state in self.collections.items()},
+            {
+                name: state.synced_counter
+                for name, state in self.collections.items()
+                if state.synced_counter is not None
+            },
+        )
+
+    async def async_refresh_collection(self, name: str) -> None:
+        """Poll one collection soon, e.g. after uploading changes to it."""
+        self.collections[name].poller.force(datetime.now(timezone.utc))
+        await self.async_request_refresh()
+
+    async def async_refresh_all(self) -> None:
+        """Poll every collection now, regardless of its schedule."""
+        now = datetime.now(timezone.utc)
+        for state in self.collections.values():
+            state.poller.force(now)
+        await self.async_refresh()
 
     async def _async_update_data(self):
-        """Called by HA at the interval defined in update_interval."""
+        """Called by HA whenever the next collection poll is due."""
         now = datetime.now(timezone.utc)
-        tasks: list[asyncio.Task] = []
+        due = [
+            state for state in self.collections.values() if state.poller.is_due(now)
+        ]
+
+        try:
+            if due:
+                await self._async_poll(due, now)
+        finally:
+            next_due = min(state.poller.next_due for state in self.collections.values())
+            self.update_interval = max(next_due - now, timedelta(minutes=MIN_POLL_INTERVAL))
+
+        return self._build_data()
+
+    async def _async_poll(self, due: list[CollectionState], now: datetime) -> None:
+        """Check the due collections and fetch the ones that changed.
+
+        Only raises UpdateFailed when every due collection failed; otherwise
+        the failures are recorded on the collections themselves.
+        """
+        changed = await self._async_changed_collections(due)
+        self._async_maybe_sync_recipes(now)
+        previous = [(state.records, state.available) for state in due]
+        results = await asyncio.gather(
+            *(self._async_poll_collection(state, state in changed, now) for state in due)
+        )
+
+        if any(state.records is not records for state, (records, _) in zip(due, previous)):
+            self._async_schedule_snapshot()
+        if any(state.available is not was for state, (_, was) in zip(due, previous)):
+            # Availability is not part of the data, so an unchanged payload
+            # would not otherwise reach the entities.
+            self.async_update_listeners()
+        if not any(results):
+            raise UpdateFailed(
+                "; ".join(f"{state.name}: {state.last_error}" for state in due)
+            )
 
-        if now - self.last_groceries_update >= self.groceries_refresh:
-            tasks.append(self._fetch_groceries())
-            self.last_groceries_update = now
+    async def _async_poll_collection(
+        self, state: CollectionState, fetch: bool, now: datetime
+    ) -> bool:
+        """Fetch one collection if needed and record the outcome."""
+        if not fetch:
+            state.last_synced = now
+            state.failures = 0
+            state.poller.record(now, False)
+            return True
 
-        if now - self.last_meals_update >= self.meals_refresh:
-            tasks.append(self._fetch_meals())
-            self.last_meals_update = now
+        try:
+            payload = await self._api_get(
+                state.name, priority=self._staleness(state), state=state
+            )
+            parsed = self._parse(state, payload) if payload is not None else None
+            # A body identical to the last one (or equal records after a
+            # restart, when no digest is known yet) keeps the existing view.
+            changed = parsed is not None and parsed.records != state.records
+            if changed:
+                self._set_records(state, parsed)
+        except UpdateFailed as err:
+            state.failures += 1
+            state.last_error = str(err)
+            state.poller.record_failure(now, state.failures)
+            _LOGGER.error("Error fetching %s data: %s", state.name, err)
+            return False
 
-        if tasks:
-            await asyncio.gather(*tasks)
+        if changed:
+            _LOGGER.debug(
+                "Successfully fetched %s: %d items",
+                state.name,
+                len(parsed.records),
+            )
+        else:
+            _LOGGER.debug("%s payload unchanged, keeping current data", state.name)
+        state.synced_counter = self._remote_counters.get(state.name)
+        state.last_synced = now
+        state.failures = 0
+        state.last_error = None
+        state.poller.record(now, changed)
+        return True
 
-        return {"groceries": self.groceries_data, "meals": self.meals_data}
+    async def _async_changed_collections(
+        self, due: list[CollectionState]
+    ) -> list[CollectionState]:
+        """Return the due collections whose sync counter has moved.
 
-<<<<<<< HEAD
-    async def _validate_response(self, data: dict, endpoint: str) -> bool:
+        Polls the cheap sync status endpoint first so full payloads are only
+        downloaded when Paprika reports a change.  If the status endpoint is
+        unavailable every due collection is treated as changed.
+        """
+        try:
+            status = await self._api_get(
+                STATUS_ENDPOINT, priority=max(self._staleness(state) for state in due)
+            )
+        except UpdateFailed as err:
+            _LOGGER.debug(
+                "Sync status unavailable, fetching %s: %s",
+                [state.name for state in due],
+                err,
+            )
+            self._remote_counters = {}
+            return due
+
+        self._remote_counters = {
+            name: counter
+            for name, counter in status["result"].items()
+            if isinstance(counter, int)
+        }
+
+        changed = []
+        for state in due:
+            counter = self._remote_counters.get(state.name)
+            if (
+                counter is None
+                or state.records is None
+                or state.failures
+                or state.synced_counter != counter
+            ):
+                changed.append(state)
+            else:
+                _LOGGER.debug(
+                    "%s unchanged (sync counter %d), skipping fetch", state.name, counter
+                )
+        return changed
+
+    def _staleness(self, state: CollectionState) -> float:
+        """Return seconds since a collection was last confirmed up to date."""
+        synced = state.last_synced or datetime.min.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - synced).total_seconds()
+
+    def _async_maybe_sync_recipes(self, now: datetime) -> None:
+        """Start a background recipe sync if the catalogue changed.
+
+        Uses the recipes counter from the status poll that just ran; without
+        one, the catalogue is re-synced every DEFAULT_RECIPES_REFRESH minutes.
+        """
+        if self.recipes is None or self.recipes.syncing:
+            return
+
+        counter = self._remote_counters.get("recipes")
+        if counter is not None:
+            if counter == self.recipes.counter:
+                return
+        elif now - self.last_recipes_sync < timedelta(minutes=DEFAULT_RECIPES_REFRESH):
+            return
+
+        self.last_recipes_sync = now
+        self.entry.async_create_background_task(
+            self.hass, self._async_sync_recipes(counter), "turmeric_recipe_sync"
+        )
+
+    async def _async_sync_recipes(self, counter: int | None) -> None:
+        """Run a recipe sync, logging rather than raising failures.
+
+        Entities reading recipes (the next meal photo) are notified when the
+        catalogue changed, since the coordinator data itself did not.
+        """
+        try:
+            changed = await self.recipes.async_sync(counter)
+        except UpdateFailed as err:
+            _LOGGER.warning("Recipe sync failed: %s", err)
+            return
+        if changed:
+            self.async_update_listeners()
+
+    def _validate_response(self, data: dict, endpoint: str) -> bool:
         """Validate API response structure matches expectations."""
         if not isinstance(data, dict):
             _LOGGER.warning(f"Invalid response type for {endpoint}: expected dict")
@@ -114,97 +472,128 @@ class TurmericCoordinator(DataUpdateCoordinator):
             _LOGGER.warning(f"Missing 'result' field in {endpoint} response")
             return False
 
+        if endpoint == STATUS_ENDPOINT or endpoint.startswith(f"{RECIPE_ENDPOINT}/"):
+            if not isinstance(data["result"], dict):
+                _LOGGER.warning(f"Invalid 'result' type for {endpoint}: expected dict")
+                return False
+            return True
+
         if not isinstance(data["result"], list):
             _LOGGER.warning(f"Invalid 'result' type for {endpoint}: expected list")
             return False
 
-        # Validate individual items
-        if endpoint == "groceries":
-            for item in data["result"]:
-                if not isinstance(item, dict) or "name" not in item:
-                    _LOGGER.warning(f"Grocery item missing required 'name' field: {item}")
-                    return False
-
-        elif endpoint == "meals":
+        # Grocery and meal items are checked one by one while they are
+        # parsed, so a malformed item is skipped instead of failing the update
+        if endpoint == RECIPES_ENDPOINT:
             for item in data["result"]:
-                if not isinstance(item, dict) or "name" not in item or "date" not in item:
-                    _LOGGER.warning(f"Meal item missing required fields: {item}")
+                if not isinstance(item, dict) or "uid" not in item or "hash" not in item:
+                    _LOGGER.warning(f"Recipe listing item missing uid or hash: {item}")
                     return False
 
         return True
 
-    async def _api_get(self, endpoint: str, max_retries: int = 3) -> dict:
-        """Make an authenticated GET request with exponential backoff on rate limit."""
-        session = async_get_clientsession(self.hass)
+    async def _api_get(
+        self,
+        endpoint: str,
+        max_retries: int = 3,
+        priority: float = 0.0,
+        state: CollectionState | None = None,
+    ) -> dict | None:
+        """Make an authenticated GET request through the shared scheduler.
+
+        `priority` orders this request against waiting requests of every
+        config entry; callers pass how stale the data they are fetching is.
+        When fetching a collection, pass its `state` to make the request
+        conditional: None is returned if the payload has not changed.
+        """
+        session = self.session
 
         for attempt in range(max_retries):
-            headers = {"Authorization": f"Bearer {self.api_token}"}
+            token = await self.token_manager.async_get_token()
+            headers = {"Authorization": f"Bearer {token}"}
+            if state is not None and state.etag and state.records is not None:
+                headers["If-None-Match"] = state.etag
+            await self.scheduler.async_acquire(priority)
+            started = time.monotonic()
 
             try:
                 async with asyncio.timeout(API_TIMEOUT):
                     async with session.get(
                         f"{BASE_URL}/{endpoint}", headers=headers
                     ) as resp:
-                        if resp.status == 401:
+                        unauthorized = resp.status == 401
+                        if unauthorized:
                             _LOGGER.debug(
                                 "Token expired for %s, attempting re-authentication",
                                 endpoint,
                             )
-                            if await self._async_re_authenticate():
-                                headers["Authorization"] = f"Bearer {self.api_token}"
-                                async with session.get(
-                                    f"{BASE_URL}/{endpoint}", headers=headers
-                                ) as retry_resp:
-                                    if retry_resp.status == 200:
-                                        data = await retry_resp.json()
-                                        if self._validate_response(data, endpoint):
-                                            return data
-                                        raise UpdateFailed(
-                                            f"Invalid response structure from {endpoint}"
-                                        )
-                                    retry_resp.raise_for_status()
-
-                            raise UpdateFailed(f"Re-authentication failed for {endpoint}")
-
-                        if resp.status == 429:
-                            retry_after = resp.headers.get("Retry-After", "unknown")
+                            self.metrics.record_reauth(endpoint)
+
+                        elif resp.status == 429:
+                            self.metrics.record_rate_limited(endpoint)
+                            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                            wait_time = backoff_delay(attempt, retry_after)
+                            # Hold back every entry's requests, not just this one
+                            self.scheduler.async_defer(wait_time)
                             if attempt < max_retries - 1:
-                                wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
                                 _LOGGER.warning(
                                     "Paprika API rate-limited for %s – "
-                                    "retrying in %d seconds (attempt %d/%d)",
+                                    "retrying in %.1f seconds (attempt %d/%d)",
                                     endpoint,
                                     wait_time,
                                     attempt + 1,
                                     max_retries,
                                 )
-                                await asyncio.sleep(wait_time)
+                                self.metrics.record_retry(endpoint)
                                 continue
                             else:
                                 _LOGGER.error(
                                     "Paprika API rate-limited for %s – "
-                                    "max retries exceeded (retry-after: %s seconds)",
+                                    "max retries exceeded (retry-after: %.1f seconds)",
                                     endpoint,
-                                    retry_after,
+                                    wait_time,
                                 )
                                 raise UpdateFailed(
-                                    f"Rate limited ({endpoint}) – retry after {retry_after}s"
+                                    f"Rate limited ({endpoint}) – retry after {wait_time:.0f}s"
                                 )
 
-                        if resp.status == 200:
-                            data = await resp.json()
-                            if self._validate_response(data, endpoint):
+                        elif resp.status in (200, 304):
+                            data = await self._async_read_payload(resp, endpoint, state)
+                            self.metrics.record_success(endpoint, time.monotonic() - started)
+                            return data
+
+                        else:
+                            resp.raise_for_status()
+
+                if unauthorized:
+                    # Log in and wait for a slot outside the request timeout,
+                    # so a scheduler pause is not mistaken for a slow request.
+                    if not await self.token_manager.async_refresh_token(token):
+                        self.metrics.record_error(endpoint, "re-authentication failed")
+                        raise UpdateFailed(f"Re-authentication failed for {endpoint}")
+                    headers["Authorization"] = f"Bearer {self.token_manager.token}"
+                    await self.scheduler.async_acquire(priority)
+                    started = time.monotonic()
+                    async with asyncio.timeout(API_TIMEOUT):
+                        async with session.get(
+                            f"{BASE_URL}/{endpoint}", headers=headers
+                        ) as retry_resp:
+                            if retry_resp.status in (200, 304):
+                                data = await self._async_read_payload(
+                                    retry_resp, endpoint, state
+                                )
+                                self.metrics.record_success(
+                                    endpoint, time.monotonic() - started
+                                )
                                 return data
-                            raise UpdateFailed(
-                                f"Invalid response structure from {endpoint}"
-                            )
-
-                        resp.raise_for_status()
+                            retry_resp.raise_for_status()
 
             except asyncio.TimeoutError:
                 _LOGGER.error("Timeout while fetching %s (attempt %d/%d)", endpoint, attempt + 1, max_retries)
+                self.metrics.record_error(endpoint, "timeout")
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    self.metrics.record_retry(endpoint)
+                    await asyncio.sleep(backoff_delay(attempt))
                     continue
                 raise UpdateFailed(f"Timeout while fetching {endpoint}")
 
@@ -216,77 +605,115 @@ class TurmericCoordinator(DataUpdateCoordinator):
                     max_retries,
                     err,
                 )
+                self.metrics.record_error(endpoint, str(err))
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    self.metrics.record_retry(endpoint)
+                    await asyncio.sleep(backoff_delay(attempt))
                     continue
                 raise UpdateFailed(f"Client error while fetching {endpoint}: {err}")
 
         raise UpdateFailed(f"Failed to fetch {endpoint} after {max_retries} attempts")
-=======
-    async def _api_get(self, endpoint: str) -> dict:
-        """Make an authenticated GET request, re-authenticating on 401."""
-        session = async_get_clientsession(self.hass)
-        headers = {"Authorization": f"Bearer {self.api_token}"}
-
-        async with asyncio.timeout(10):
-            async with session.get(
-                f"{BASE_URL}/{endpoint}", headers=headers
-            ) as resp:
-                if resp.status == 401:
-                    _LOGGER.debug("Token expired for %s, re-authenticating", endpoint)
-                    if await self._async_re_authenticate():
-                        headers["Authorization"] = f"Bearer {self.api_token}"
-                        async with session.get(
-                            f"{BASE_URL}/{endpoint}", headers=headers
-                        ) as retry_resp:
-                            retry_resp.raise_for_status()
-                            return await retry_resp.json()
-                    raise UpdateFailed(f"Re-authentication failed for {endpoint}")
-
-                if resp.status == 429:
-                    retry = resp.headers.get("Retry-After", "unknown")
-                    _LOGGER.warning(
-                        "Paprika rate-limited %s request – retry after %s seconds",
-                        endpoint,
-                        retry,
-                    )
-                    raise UpdateFailed(f"Rate limited ({endpoint})")
-
-                resp.raise_for_status()
-                return await resp.json()
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
-
-    async def _fetch_groceries(self):
-        """Fetch groceries data from the Paprika API."""
-        try:
-            self.groceries_data = await self._api_get("groceries")
-<<<<<<< HEAD
-            _LOGGER.debug(
-                "Successfully fetched groceries: %d items",
-                len(self.groceries_data.get("result", [])),
-            )
-=======
-            _LOGGER.debug("Fetched groceries data: %s", self.groceries_data)
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
-        except Exception as err:
-            _LOGGER.error("Error fetching groceries data: %s", err)
-            raise UpdateFailed(f"Failed to update groceries: {err}") from err
-
-    async def _fetch_meals(self):
-        """Fetch meals data from the Paprika API."""
+
+    async def _async_read_payload(
+        self, resp, endpoint: str, state: CollectionState | None
+    ) -> dict | None:
+        """Decode and validate a response, or return None if it is unchanged.
+
+        For collections the raw body is hashed before decoding, so an
+        unchanged list costs neither a JSON decode nor validation even when
+        Paprika sends no ETag.
+        """
+        if resp.status == 304:
+            if state is None or state.records is None:
+                raise UpdateFailed(f"Unexpected 304 from {endpoint}")
+            self.metrics.record_body(endpoint, 0, None)
+            return None
+
+        body = await resp.read()
+        if state is not None:
+            digest = hashlib.sha256(body).hexdigest()
+            if digest == state.digest and state.records is not None:
+                state.etag = resp.headers.get("ETag") or state.etag
+                self.metrics.record_body(endpoint, len(body), None)
+                return None
+
+        started = time.perf_counter()
         try:
-            self.meals_data = await self._api_get("meals")
-<<<<<<< HEAD
-            _LOGGER.debug(
-                "Successfully fetched meals: %d items",
-                len(self.meals_data.get("result", [])),
+            data = json.loads(body)
+        except ValueError as err:
+            self.metrics.record_error(endpoint, "invalid JSON")
+            raise UpdateFailed(f"Invalid JSON from {endpoint}: {err}") from err
+        if not self._validate_response(data, endpoint):
+            self.metrics.record_error(endpoint, "invalid response structure")
+            raise UpdateFailed(f"Invalid response structure from {endpoint}")
+        self.metrics.record_body(endpoint, len(body), time.perf_counter() - started)
+
+        if state is not None:
+            state.etag = resp.headers.get("ETag")
+            state.digest = digest
+        return data
+
+    async def async_upload(self, endpoint: str, items: list[dict], max_retries: int = 3) -> None:
+        """Upload `items` to a Paprika sync endpoint.
+
+        Paprika expects the JSON list gzipped in a multipart `data` field.
+        Uploads are user edits, so they jump the shared request queue.
+        """
+        body = gzip.compress(json.dumps(items, separators=(",", ":")).encode())
+        session = self.session
+        reauthenticated = False
+        metric = f"{endpoint}_upload"
+
+        for attempt in range(max_retries):
+            token = await self.token_manager.async_get_token()
+            form = aiohttp.FormData()
+            form.add_field(
+                "data", body, filename="data", content_type="application/octet-stream"
             )
-        except Exception as err:
-            _LOGGER.error("Error fetching meals data: %s", err)
-            raise UpdateFailed(f"Failed to update meals: {err}") from err
-=======
-            _LOGGER.debug("Fetched meals data: %s", self.meals_data)
-        except Exception as err:
-            _LOGGER.error("Error fetching meals data: %s", err)
-            raise UpdateFailed(f"Failed to update meals: {err}") from err
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
+            await self.scheduler.async_acquire(math.inf)
+            started = time.monotonic()
+
+            try:
+                async with asyncio.timeout(API_TIMEOUT):
+                    async with session.post(
+                        f"{BASE_URL}/{endpoint}",
+                        data=form,
+                        headers={"Authorization": f"Bearer {token}"},
+                    ) as resp:
+                        unauthorized = resp.status == 401 and not reauthenticated
+                        if unauthorized:
+                            reauthenticated = True
+                            self.metrics.record_reauth(metric)
+
+                        elif resp.status == 429:
+                            wait_time = backoff_delay(
+                                attempt, parse_retry_after(resp.headers.get("Retry-After"))
+                            )
+                            self.scheduler.async_defer(wait_time)
+                            self.metrics.record_rate_limited(metric)
+                            self.metrics.record_retry(metric)
+                            continue
+
+                        else:
+                            resp.raise_for_status()
+                            self.metrics.record_success(metric, time.monotonic() - started)
+                            return
+
+                # Log in outside the request timeout, like _api_get
+                if await self.token_manager.async_refresh_token(token):
+                    continue
+                raise UpdateFailed(f"Re-authentication failed for {endpoint}")
+
+            except asyncio.TimeoutError:
+                self.metrics.record_error(metric, "timeout")
+                if attempt < max_retries - 1:
+                    self.metrics.record_retry(metric)
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                raise UpdateFailed(f"Timeout while uploading {endpoint}")
+
+            except aiohttp.ClientError as err:
+                self.metrics.record_error(metric, str(err))
+                raise UpdateFailed(f"Client error while uploading {endpoint}: {err}")
+
+        raise UpdateFailed(f"Failed to upload {endpoint} after {max_retries} attempts")
@@ -0,0 +1,57 @@
+"""Diagnostics support for Turmeric."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
+
+from .capture import TurmericCaptureSession
+from .const import DOMAIN
+
+TO_REDACT = {CONF_EMAIL, CONF_PASSWORD, "api_token"}
+
+
+async def async_get_config_entry_diagnostics(hass, entry) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    collections = {}
+    for name, state in coordinator.collections.items():
+        collections[name] = {
+            "available": state.available,
+            "items": len(state.records or ()),
+            "synced_counter": state.synced_counter,
+            "last_synced": state.last_synced.isoformat() if state.last_synced else None,
+            "failures": state.failures,
+            "quarantined": state.quarantined,
+            "last_error": state.last_error,
+            "has_etag": state.etag is not None,
+            "poll_interval_s": state.poller.interval.total_seconds(),
+            "next_due": state.poller.next_due.isoformat(),
+        }
+
+    capture = coordinator.session
+    if not isinstance(capture, TurmericCaptureSession):
+        capture = None
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "last_update_success": coordinator.last_update_success,
+        "update_interval_s": (
+            coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None
+        ),
+        "remote_counters": coordinator._remote_counters,
+        "collections": collections,
+        "pending_grocery_edits": coordinator.writer.pending,
+        "recipes": (
+            len(coordinator.recipes.recipes) if coordinator.recipes is not None else None
+        ),
+        "metrics": coordinator.metrics.as_dict(),
+        "capture": (
+            {"mode": capture.mode, "exchanges": capture.exchanges}
+            if capture is not None
+            else None
+        ),
+    }
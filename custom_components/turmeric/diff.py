@@ -0,0 +1,33 @@
+"""Keyed diffs between successive Turmeric payloads."""
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+
+class KeyedDiff(NamedTuple):
+    """Items added, removed and changed between two keyed collections."""
+
+    added: dict[str, Any]
+    removed: dict[str, Any]
+    changed: dict[str, Any]
+
+    def __bool__(self) -> bool:
+        """Return True if anything differs."""
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff_keyed(old: Mapping[str, Any], new: Mapping[str, Any]) -> KeyedDiff:
+    """Compare two collections keyed by uid.
+
+    `removed` carries the old values, `added` and `changed` the new ones.
+    Values are compared with ==, so unchanged items cost one comparison.
+    """
+    added = {}
+    changed = {}
+    for key, value in new.items():
+        previous = old.get(key)
+        if previous is None:
+            added[key] = value
+        elif previous is not value and previous != value:
+            changed[key] = value
+    removed = {key: value for key, value in old.items() if key not in new}
+    return KeyedDiff(added, removed, changed)
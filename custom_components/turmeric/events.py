@@ -0,0 +1,67 @@
+"""Fine-grained events describing changes between two fetched lists."""
+from collections.abc import Iterator
+
+from .const import (
+    EVENT_GROCERY_ADDED,
+    EVENT_GROCERY_CHECKED,
+    EVENT_GROCERY_REMOVED,
+    EVENT_MEAL_CHANGED,
+    MEAL_TYPES,
+)
+from .diff import diff_keyed
+from .parser import GroceryRecord, MealRecord
+
+
+def _grocery_data(record: GroceryRecord) -> dict:
+    """Return the event data describing a grocery item."""
+    return {
+        "uid": record.uid,
+        "name": record.name,
+        "aisle": record.aisle,
+        "purchased": record.purchased,
+    }
+
+
+def _meal_data(record: MealRecord) -> dict:
+    """Return the event data describing a meal."""
+    return {
+        "uid": record.uid,
+        "name": record.name,
+        "date": record.date,
+        "type": MEAL_TYPES.get(record.type, "Meal"),
+        "recipe_uid": record.recipe_uid,
+    }
+
+
+def grocery_events(
+    old: dict[str, GroceryRecord], new: dict[str, GroceryRecord]
+) -> Iterator[tuple[str, dict]]:
+    """Yield (event type, data) for items added, removed or (un)checked.
+
+    Other edits to an item, such as a new quantity, fire no event.
+    """
+    diff = diff_keyed(old, new)
+    for record in diff.added.values():
+        yield EVENT_GROCERY_ADDED, _grocery_data(record)
+    for record in diff.removed.values():
+        yield EVENT_GROCERY_REMOVED, _grocery_data(record)
+    for key, record in diff.changed.items():
+        if record.purchased != old[key].purchased:
+            yield EVENT_GROCERY_CHECKED, _grocery_data(record)
+
+
+def meal_events(
+    old: dict[str, MealRecord], new: dict[str, MealRecord]
+) -> Iterator[tuple[str, dict]]:
+    """Yield a meal-changed event for every added, removed or edited meal."""
+    diff = diff_keyed(old, new)
+    for action, records in (
+        ("added", diff.added),
+        ("removed", diff.removed),
+        ("changed", diff.changed),
+    ):
+        for record in records.values():
+            yield EVENT_MEAL_CHANGED, {"action": action, **_meal_data(record)}
+
+
+DIFF_EVENTS = {"groceries": grocery_events, "meals": meal_events}
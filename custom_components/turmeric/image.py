@@ -0,0 +1,94 @@
+"""Image platform for Turmeric integration."""
+import mimetypes
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, UPCOMING_MEALS
+
+
+class TurmericMealPhoto(CoordinatorEntity, ImageEntity):
+    """Photo of the next planned meal, served from the local photo cache."""
+
+    def __init__(self, hass, coordinator, entry_id):
+        """Initialize the image entity."""
+        CoordinatorEntity.__init__(self, coordinator)
+        ImageEntity.__init__(self, hass)
+        self._entry_id = entry_id
+        self._photo_url: str | None = None
+
+    @property
+    def name(self):
+        """Return the name of the image entity."""
+        return "Turmeric Next Meal Photo"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID for the image entity."""
+        return f"turmeric_next_meal_photo_{self._entry_id}"
+
+    @property
+    def available(self):
+        """Return True if the meal plan was last polled successfully."""
+        return self.coordinator.collections["meals"].available
+
+    async def async_added_to_hass(self) -> None:
+        """Pick up the current photo once added."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Track the next meal's photo and prefetch upcoming ones."""
+        urls = self._upcoming_photo_urls()
+        photo_url = urls[0] if urls else None
+        if photo_url != self._photo_url:
+            self._photo_url = photo_url
+            self._attr_image_last_updated = dt_util.utcnow()
+            if photo_url:
+                self._attr_content_type = (
+                    mimetypes.guess_type(photo_url.split("?", 1)[0])[0] or "image/jpeg"
+                )
+        if urls:
+            self.hass.async_create_background_task(
+                self.coordinator.photos.async_prefetch(urls), "turmeric_photo_prefetch"
+            )
+        super()._handle_coordinator_update()
+
+    def _upcoming_photo_urls(self) -> list[str]:
+        """Return photo URLs of upcoming meals that have one, soonest first."""
+        view = self.coordinator.data and self.coordinator.data.get("meals")
+        recipes = self.coordinator.recipes
+        if view is None or recipes is None:
+            return []
+
+        urls = []
+        for meal in view.next_from_day(dt_util.now().date(), UPCOMING_MEALS):
+            recipe = recipes.recipes.get(meal.recipe_uid) if meal.recipe_uid else None
+            url = recipe and (recipe.get("photo_url") or recipe.get("image_url"))
+            if url and url not in urls:
+                urls.append(url)
+        return urls
+
+    async def async_image(self) -> bytes | None:
+        """Return the cached photo of the next meal."""
+        if self._photo_url is None:
+            return None
+        path = await self.coordinator.photos.async_get(self._photo_url)
+        if path is None:
+            return None
+        try:
+            return await self.hass.async_add_executor_job(path.read_bytes)
+        except OSError:
+            # Evicted between lookup and read; the next request re-downloads it.
+            return None
+
+
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    """Set up the Turmeric meal photo based on a config entry."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    if coordinator.photos is None:
+        return
+    async_add_entities([TurmericMealPhoto(hass, coordinator, config_entry.entry_id)])
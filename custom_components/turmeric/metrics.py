@@ -0,0 +1,122 @@
+"""Request metrics for the Turmeric integration."""
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
+
+from .const import LATENCY_BUCKETS
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and a latency histogram for one Paprika endpoint."""
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    reauths: int = 0
+    rate_limited: int = 0
+    unchanged: int = 0
+    bytes_received: int = 0
+    latency_total: float = 0.0
+    last_latency: float | None = None
+    parse_total: float = 0.0
+    parses: int = 0
+    # One count per LATENCY_BUCKETS bound, plus one for slower requests
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    last_success: datetime | None = None
+    last_error: str | None = None
+
+    def as_dict(self) -> dict:
+        """Return the metrics in a JSON-friendly form."""
+        successes = sum(self.histogram)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "reauths": self.reauths,
+            "rate_limited": self.rate_limited,
+            "unchanged": self.unchanged,
+            "bytes_received": self.bytes_received,
+            "last_latency_ms": (
+                round(self.last_latency * 1000, 1) if self.last_latency is not None else None
+            ),
+            "average_latency_ms": (
+                round(self.latency_total / successes * 1000, 1) if successes else None
+            ),
+            "average_parse_ms": (
+                round(self.parse_total / self.parses * 1000, 2) if self.parses else None
+            ),
+            "latency_histogram": {
+                f"le_{bound}s": count
+                for bound, count in zip((*LATENCY_BUCKETS, "inf"), self.histogram)
+            },
+            "last_success": self.last_success.isoformat() if self.last_success else None,
+            "last_error": self.last_error,
+        }
+
+
+class TurmericMetrics:
+    """Per-endpoint request metrics of one config entry.
+
+    Recipe downloads (`recipe/<uid>`) are counted under `recipe`, so the
+    number of tracked endpoints stays fixed.
+    """
+
+    def __init__(self) -> None:
+        """Initialise empty metrics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def get(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, creating them on first use."""
+        key = endpoint.split("/", 1)[0]
+        if key not in self.endpoints:
+            self.endpoints[key] = EndpointMetrics()
+        return self.endpoints[key]
+
+    def record_success(self, endpoint: str, latency: float) -> None:
+        """Record a completed request and its latency in seconds."""
+        metrics = self.get(endpoint)
+        metrics.requests += 1
+        metrics.latency_total += latency
+        metrics.last_latency = latency
+        metrics.histogram[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        metrics.last_success = dt_util.utcnow()
+
+    def record_body(self, endpoint: str, size: int, parse_time: float | None) -> None:
+        """Record a response body; `parse_time` is None if it was not decoded."""
+        metrics = self.get(endpoint)
+        metrics.bytes_received += size
+        if parse_time is None:
+            metrics.unchanged += 1
+        else:
+            metrics.parse_total += parse_time
+            metrics.parses += 1
+
+    def record_error(self, endpoint: str, error: str) -> None:
+        """Record a failed request."""
+        metrics = self.get(endpoint)
+        metrics.requests += 1
+        metrics.errors += 1
+        metrics.last_error = error
+
+    def record_retry(self, endpoint: str) -> None:
+        """Record that a request is being retried."""
+        self.get(endpoint).retries += 1
+
+    def record_reauth(self, endpoint: str) -> None:
+        """Record a 401 that forced a re-login."""
+        metrics = self.get(endpoint)
+        metrics.requests += 1
+        metrics.reauths += 1
+
+    def record_rate_limited(self, endpoint: str) -> None:
+        """Record a 429 response."""
+        metrics = self.get(endpoint)
+        metrics.requests += 1
+        metrics.rate_limited += 1
+
+    def as_dict(self) -> dict:
+        """Return every endpoint's metrics."""
+        return {name: metrics.as_dict() for name, metrics in self.endpoints.items()}
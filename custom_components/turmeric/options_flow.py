@@ -1,20 +1,20 @@
 """Options flow for Turmeric integration."""
-<<<<<<< HEAD
 import logging
 
-=======
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
 import voluptuous as vol
 
 from homeassistant import config_entries
 
-from .const import DEFAULT_GROCERIES_REFRESH, DEFAULT_MEALS_REFRESH
+from .const import (
+    CAPTURE_MODES,
+    CAPTURE_OFF,
+    DEFAULT_GROCERIES_REFRESH,
+    DEFAULT_MEALS_REFRESH,
+)
+from .polling import parse_active_times
 
-<<<<<<< HEAD
 _LOGGER = logging.getLogger(__name__)
 
-=======
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
 
 class TurmericOptionsFlowHandler(config_entries.OptionsFlow):
     """Handle Turmeric options."""
@@ -25,9 +25,17 @@ class TurmericOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the Turmeric options."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            _LOGGER.debug("Turmeric options updated: %s", user_input)
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                parse_active_times(user_input.get("shopping_times"))
+                parse_active_times(user_input.get("meal_times"))
+            except ValueError:
+                errors["base"] = "invalid_times"
+            else:
+                _LOGGER.debug("Turmeric options updated: %s", user_input)
+                return self.async_create_entry(title="", data=user_input)
 
         options_schema = vol.Schema(
             {
@@ -49,11 +57,33 @@ class TurmericOptionsFlowHandler(config_entries.OptionsFlow):
                         ),
                     ),
                 ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                vol.Optional(
+                    "shopping_times",
+                    default=self.config_entry.options.get("shopping_times", ""),
+                ): str,
+                vol.Optional(
+                    "meal_times",
+                    default=self.config_entry.options.get("meal_times", ""),
+                ): str,
+                vol.Optional(
+                    "sync_recipes",
+                    default=self.config_entry.options.get("sync_recipes", False),
+                ): bool,
+                vol.Optional(
+                    "compact_history",
+                    default=self.config_entry.options.get("compact_history", False),
+                ): bool,
+                vol.Optional(
+                    "aisle_sensors",
+                    default=self.config_entry.options.get("aisle_sensors", False),
+                ): bool,
+                vol.Optional(
+                    "capture_mode",
+                    default=self.config_entry.options.get("capture_mode", CAPTURE_OFF),
+                ): vol.In(CAPTURE_MODES),
             }
         )
 
-<<<<<<< HEAD
-        return self.async_show_form(step_id="init", data_schema=options_schema)
-=======
-        return self.async_show_form(step_id="init", data_schema=options_schema)
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
+        return self.async_show_form(
+            step_id="init", data_schema=options_schema, errors=errors
+        )
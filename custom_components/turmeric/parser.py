@@ -0,0 +1,216 @@
+"""Single-pass parsing of Paprika collections into typed records.
+
+Each raw item is validated and converted exactly once, when a payload is
+received.  Items that cannot be parsed are quarantined: they are counted and
+logged, and the rest of the payload is used as normal, so one malformed
+grocery item or meal no longer rejects the whole update.
+
+Records use __slots__ and share one string object for each aisle, list and
+other repetitive value, so a long grocery list or meal history costs far
+less memory than the decoded JSON it came from.
+"""
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, NamedTuple
+
+from .const import DEFAULT_MEAL_TYPE, MEAL_DATE_FORMAT
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_AISLE = "Uncategorized"
+
+
+@dataclass(frozen=True, slots=True)
+class GroceryRecord:
+    """A grocery item with the fields Turmeric reads or writes back."""
+
+    uid: str | None
+    name: str
+    aisle: str
+    purchased: bool
+    quantity: str
+    ingredient: str | None
+    instruction: str
+    recipe: str | None
+    recipe_uid: str | None
+    order_flag: int
+    separate: bool
+    aisle_uid: str | None
+    list_uid: str | None
+
+    def to_item(self) -> dict:
+        """Return the item in Paprika's JSON form, e.g. for uploading it."""
+        return {
+            "uid": self.uid,
+            "name": self.name,
+            "aisle": self.aisle,
+            "purchased": self.purchased,
+            "quantity": self.quantity,
+            "ingredient": self.ingredient,
+            "instruction": self.instruction,
+            "recipe": self.recipe,
+            "recipe_uid": self.recipe_uid,
+            "order_flag": self.order_flag,
+            "separate": self.separate,
+            "aisle_uid": self.aisle_uid,
+            "list_uid": self.list_uid,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class MealRecord:
+    """A planned meal with its date already parsed.
+
+    `when` is Paprika's local wall-clock date and time.  It carries a UTC
+    tzinfo only so it sorts against the meal index keys; it is not a UTC
+    instant and must not be converted to local time again.
+    """
+
+    uid: str | None
+    name: str
+    when: datetime
+    type: int
+    recipe_uid: str | None
+
+    @property
+    def date(self) -> str:
+        """Return the meal date in Paprika's format."""
+        return self.when.strftime(MEAL_DATE_FORMAT)
+
+    def to_item(self) -> dict:
+        """Return the meal in Paprika's JSON form."""
+        return {
+            "uid": self.uid,
+            "name": self.name,
+            "date": self.date,
+            "type": self.type,
+            "recipe_uid": self.recipe_uid,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class GroceryListRecord:
+    """A grocery list (e.g. one per store)."""
+
+    uid: str
+    name: str
+    order_flag: int
+    is_default: bool
+
+    def to_item(self) -> dict:
+        """Return the list in Paprika's JSON form."""
+        return {
+            "uid": self.uid,
+            "name": self.name,
+            "order_flag": self.order_flag,
+            "is_default": self.is_default,
+        }
+
+
+class ParseResult(NamedTuple):
+    """Records parsed from a collection and how many items were rejected."""
+
+    records: list
+    quarantined: int
+
+
+def _text(item: dict, field: str) -> str:
+    """Return a required, non-empty string field."""
+    value = item[field]
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"'{field}' must be a non-empty string")
+    return value
+
+
+def _optional_text(item: dict, field: str, default: str | None = None) -> str | None:
+    """Return an optional string field, or `default` if it is missing."""
+    value = item.get(field)
+    if value is None:
+        return default
+    if not isinstance(value, str):
+        raise ValueError(f"'{field}' must be a string")
+    return value
+
+
+def _interned(value: str | None) -> str | None:
+    """Return the shared copy of a frequently repeated string."""
+    return sys.intern(value) if value else value
+
+
+def parse_grocery(item: Any) -> GroceryRecord:
+    """Convert a raw grocery item, raising ValueError if it is malformed."""
+    if not isinstance(item, dict):
+        raise ValueError("item is not an object")
+    order_flag = item.get("order_flag")
+    return GroceryRecord(
+        uid=_optional_text(item, "uid") or None,
+        name=_text(item, "name"),
+        aisle=_interned(_optional_text(item, "aisle", DEFAULT_AISLE)),
+        purchased=bool(item.get("purchased")),
+        quantity=_interned(_optional_text(item, "quantity", "")),
+        ingredient=_optional_text(item, "ingredient"),
+        instruction=_optional_text(item, "instruction", ""),
+        recipe=_optional_text(item, "recipe"),
+        recipe_uid=_optional_text(item, "recipe_uid") or None,
+        order_flag=order_flag if isinstance(order_flag, int) else 0,
+        separate=bool(item.get("separate")),
+        aisle_uid=_interned(_optional_text(item, "aisle_uid")) or None,
+        list_uid=_interned(_optional_text(item, "list_uid")) or None,
+    )
+
+
+def parse_meal(item: Any) -> MealRecord:
+    """Convert a raw meal, raising ValueError if it is malformed."""
+    if not isinstance(item, dict):
+        raise ValueError("item is not an object")
+    meal_type = item.get("type", DEFAULT_MEAL_TYPE)
+    return MealRecord(
+        uid=_optional_text(item, "uid") or None,
+        name=_interned(_text(item, "name")),
+        when=datetime.strptime(_text(item, "date"), MEAL_DATE_FORMAT).replace(
+            tzinfo=timezone.utc
+        ),
+        type=meal_type if isinstance(meal_type, int) else DEFAULT_MEAL_TYPE,
+        recipe_uid=_optional_text(item, "recipe_uid") or None,
+    )
+
+
+def parse_grocery_list(item: Any) -> GroceryListRecord:
+    """Convert raw grocery list metadata, raising ValueError if malformed."""
+    if not isinstance(item, dict):
+        raise ValueError("item is not an object")
+    order_flag = item.get("order_flag")
+    return GroceryListRecord(
+        uid=_text(item, "uid"),
+        name=_text(item, "name"),
+        order_flag=order_flag if isinstance(order_flag, int) else 0,
+        is_default=bool(item.get("is_default")),
+    )
+
+
+PARSERS = {
+    "groceries": parse_grocery,
+    "meals": parse_meal,
+    "grocerylists": parse_grocery_list,
+}
+
+
+def parse_collection(name: str, items: list) -> ParseResult:
+    """Parse every item of a collection, quarantining malformed ones."""
+    parse = PARSERS[name]
+    records = []
+    quarantined = 0
+    for item in items:
+        try:
+            records.append(parse(item))
+        except (KeyError, TypeError, ValueError) as err:
+            quarantined += 1
+            _LOGGER.debug("Quarantined %s item %r: %s", name, item, err)
+
+    if quarantined:
+        _LOGGER.warning(
+            "Skipped %d malformed %s item(s) out of %d", quarantined, name, len(items)
+        )
+    return ParseResult(records, quarantined)
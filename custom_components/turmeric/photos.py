@@ -0,0 +1,149 @@
+"""On-disk LRU cache for Paprika recipe photos."""
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+from collections import OrderedDict
+from pathlib import Path
+
+import aiohttp
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import (
+    API_TIMEOUT,
+    DOMAIN,
+    PHOTO_CACHE_MAX_BYTES,
+    PHOTO_CHUNK_SIZE,
+    PHOTO_MAX_BYTES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _photo_dir(hass, entry_id: str) -> Path:
+    """Return the photo cache directory of a config entry."""
+    return Path(hass.config.path(STORAGE_DIR, DOMAIN, "photos", entry_id))
+
+
+async def async_remove_photo_cache(hass, entry_id: str) -> None:
+    """Delete the cached photos of a config entry."""
+    await hass.async_add_executor_job(
+        lambda: shutil.rmtree(_photo_dir(hass, entry_id), ignore_errors=True)
+    )
+
+
+def _scan(directory: Path) -> list[tuple[str, int]]:
+    """Return (key, size) of cached photos, least recently written first."""
+    directory.mkdir(parents=True, exist_ok=True)
+    entries = []
+    for path in directory.iterdir():
+        if path.suffix == ".part":
+            path.unlink(missing_ok=True)
+            continue
+        stat = path.stat()
+        entries.append((stat.st_mtime, path.name, stat.st_size))
+    entries.sort()
+    return [(name, size) for _, name, size in entries]
+
+
+class TurmericPhotoCache:
+    """Size-bounded LRU cache of recipe photos for one config entry.
+
+    Photos are streamed from Paprika's CDN to disk in PHOTO_CHUNK_SIZE chunks
+    so a download never holds a whole image in memory, and the least recently
+    used photos are deleted once the cache exceeds PHOTO_CACHE_MAX_BYTES.
+    """
+
+    def __init__(self, hass, entry_id: str) -> None:
+        """Initialise the cache directory for a config entry."""
+        self.hass = hass
+        self._dir = _photo_dir(hass, entry_id)
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._downloads: dict[str, asyncio.Task] = {}
+
+    async def async_load(self) -> None:
+        """Index the photos already on disk."""
+        for key, size in await self.hass.async_add_executor_job(_scan, self._dir):
+            self._entries[key] = size
+            self._size += size
+        await self._async_evict()
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        """Return the cache key (and file name) for a photo URL."""
+        suffix = os.path.splitext(url.split("?", 1)[0])[1].lower()
+        if suffix not in (".jpg", ".jpeg", ".png", ".gif", ".webp"):
+            suffix = ".jpg"
+        return hashlib.sha1(url.encode()).hexdigest() + suffix
+
+    async def async_get(self, url: str) -> Path | None:
+        """Return the local path of a photo, downloading it if needed."""
+        key = self.key_for(url)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._dir / key
+
+        if key not in self._downloads:
+            self._downloads[key] = self.hass.async_create_task(
+                self._async_download(url, key), "turmeric_photo_download"
+            )
+        task = self._downloads[key]
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._downloads.pop(key, None)
+
+    async def async_prefetch(self, urls) -> None:
+        """Download any of `urls` that are not cached yet."""
+        await asyncio.gather(*(self.async_get(url) for url in urls if url))
+
+    async def _async_download(self, url: str, key: str) -> Path | None:
+        """Stream a photo to disk and add it to the cache."""
+        path = self._dir / key
+        partial = path.with_suffix(".part")
+        session = async_get_clientsession(self.hass)
+        size = 0
+        try:
+            async with asyncio.timeout(API_TIMEOUT * 3):
+                async with session.get(url) as resp:
+                    resp.raise_for_status()
+                    handle = await self.hass.async_add_executor_job(partial.open, "wb")
+                    try:
+                        async for chunk in resp.content.iter_chunked(PHOTO_CHUNK_SIZE):
+                            size += len(chunk)
+                            if size > PHOTO_MAX_BYTES:
+                                raise ValueError(
+                                    f"photo larger than {PHOTO_MAX_BYTES} bytes"
+                                )
+                            await self.hass.async_add_executor_job(handle.write, chunk)
+                    finally:
+                        await self.hass.async_add_executor_job(handle.close)
+            await self.hass.async_add_executor_job(os.replace, partial, path)
+        except (asyncio.TimeoutError, aiohttp.ClientError, OSError, ValueError) as err:
+            _LOGGER.debug("Failed to cache photo %s: %s", url, err)
+            await self.hass.async_add_executor_job(
+                lambda: partial.unlink(missing_ok=True)
+            )
+            return None
+
+        self._entries[key] = size
+        self._size += size
+        await self._async_evict()
+        return path
+
+    async def _async_evict(self) -> None:
+        """Delete least recently used photos until the cache fits its budget."""
+        evicted: list[Path] = []
+        while self._size > PHOTO_CACHE_MAX_BYTES and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            evicted.append(self._dir / key)
+        if evicted:
+            await self.hass.async_add_executor_job(
+                lambda: [path.unlink(missing_ok=True) for path in evicted]
+            )
@@ -0,0 +1,101 @@
+"""Adaptive poll intervals for Turmeric collections."""
+from datetime import datetime, time, timedelta
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ADAPTIVE_ACTIVE_WINDOW,
+    ADAPTIVE_BACKOFF,
+    ADAPTIVE_CHANGE_SMOOTHING,
+    ADAPTIVE_MIN_INTERVAL,
+)
+
+
+def parse_active_times(value: str | None) -> list[time]:
+    """Parse a comma-separated list of HH:MM times, ignoring blanks.
+
+    Raises ValueError on malformed entries.
+    """
+    times = []
+    for part in (value or "").split(","):
+        part = part.strip()
+        if part:
+            times.append(datetime.strptime(part, "%H:%M").time())
+    return times
+
+
+class AdaptivePoller:
+    """Decide when a collection is next worth polling.
+
+    After a change the collection is polled every ADAPTIVE_MIN_INTERVAL
+    minutes.  Each poll that finds nothing new stretches the interval by
+    ADAPTIVE_BACKOFF, up to `ceiling` (the configured refresh interval) and
+    never beyond half the smoothed time between observed changes.  Within
+    ADAPTIVE_ACTIVE_WINDOW minutes of a configured active time (shopping or
+    meal times) the minimum interval is used again.
+    """
+
+    def __init__(self, ceiling: timedelta, active_times: list[time]) -> None:
+        """Initialise the poller; it is due immediately."""
+        self.ceiling = ceiling
+        self.floor = min(timedelta(minutes=ADAPTIVE_MIN_INTERVAL), ceiling)
+        self.active_times = active_times
+        self.interval = self.floor
+        self.next_due: datetime = dt_util.utcnow()
+        self.last_change: datetime | None = None
+        self.change_gap: float | None = None  # smoothed seconds between changes
+
+    def is_due(self, now: datetime) -> bool:
+        """Return True if the collection should be polled at `now`."""
+        return now >= self.next_due
+
+    def force(self, now: datetime) -> None:
+        """Make the collection due right away."""
+        self.next_due = now
+
+    def record(self, now: datetime, changed: bool) -> None:
+        """Record a poll result and schedule the next poll."""
+        if changed:
+            if self.last_change is not None:
+                gap = (now - self.last_change).total_seconds()
+                self.change_gap = (
+                    gap
+                    if self.change_gap is None
+                    else ADAPTIVE_CHANGE_SMOOTHING * gap
+                    + (1 - ADAPTIVE_CHANGE_SMOOTHING) * self.change_gap
+                )
+            self.last_change = now
+            self.interval = self.floor
+        else:
+            limit = self.ceiling
+            if self.change_gap is not None:
+                limit = min(limit, max(self.floor, timedelta(seconds=self.change_gap / 2)))
+            self.interval = min(limit, self.interval * ADAPTIVE_BACKOFF)
+
+        self.next_due = now + self._interval_at(now)
+
+    def record_failure(self, now: datetime, failures: int) -> None:
+        """Schedule a retry after `failures` consecutive failed polls.
+
+        Retries start at the floor and double with every failure, capped at
+        the ceiling; the adaptive interval itself is left untouched.
+        """
+        self.next_due = now + min(self.ceiling, self.floor * 2 ** (failures - 1))
+
+    def _interval_at(self, now: datetime) -> timedelta:
+        """Return the interval to use from `now`, honouring active times."""
+        window = timedelta(minutes=ADAPTIVE_ACTIVE_WINDOW)
+        local_now = dt_util.as_local(now)
+        interval = self.interval
+        for active in self.active_times:
+            for day in (-1, 0, 1):
+                centre = datetime.combine(
+                    local_now.date() + timedelta(days=day), active, local_now.tzinfo
+                )
+                if abs(local_now - centre) <= window:
+                    return self.floor
+                start = centre - window
+                if local_now < start:
+                    # Wake up for the start of the next active window
+                    interval = min(interval, start - local_now)
+        return max(interval, self.floor)
@@ -0,0 +1,134 @@
+"""Recipe catalogue sync for the Turmeric integration."""
+import asyncio
+import logging
+
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import (
+    DOMAIN,
+    RECIPE_ENDPOINT,
+    RECIPE_FETCH_CONCURRENCY,
+    RECIPE_FIELDS,
+    RECIPES_ENDPOINT,
+    RECIPES_SAVE_DELAY,
+    RECIPES_VERSION,
+)
+
+from .search import RecipeSearchIndex
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _recipe_store(hass, entry_id: str) -> Store:
+    """Return the Store holding the recipes of a config entry."""
+    return Store(hass, RECIPES_VERSION, f"{DOMAIN}.{entry_id}.recipes", private=True)
+
+
+async def async_remove_recipe_store(hass, entry_id: str) -> None:
+    """Delete the persisted recipes of a config entry."""
+    await _recipe_store(hass, entry_id).async_remove()
+
+
+class TurmericRecipeSync:
+    """Keep a local, persisted copy of the Paprika recipe catalogue.
+
+    Paprika's `recipes` endpoint lists every recipe as a uid/hash pair.  The
+    hashes are diffed against the local store so only new or changed recipes
+    are downloaded (at most RECIPE_FETCH_CONCURRENCY at a time) and recipes
+    that disappeared from the listing are dropped.  The search index is
+    updated recipe by recipe as the catalogue changes.
+    """
+
+    def __init__(self, coordinator) -> None:
+        """Initialise the recipe sync for a coordinator's config entry."""
+        self.coordinator = coordinator
+        self._store = _recipe_store(coordinator.hass, coordinator.entry.entry_id)
+        self.recipes: dict[str, dict] = {}
+        self.index = RecipeSearchIndex()
+        self.counter: int | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the persisted recipes."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self.recipes = stored.get("recipes") or {}
+        self.counter = stored.get("counter")
+        self.index = await self.coordinator.hass.async_add_executor_job(
+            RecipeSearchIndex.from_recipes, self.recipes
+        )
+        _LOGGER.debug("Loaded %d stored recipes", len(self.recipes))
+
+    @property
+    def syncing(self) -> bool:
+        """Return True while a sync is running."""
+        return self._lock.locked()
+
+    async def async_sync(self, counter: int | None = None) -> bool:
+        """Bring the local catalogue in line with Paprika.
+
+        `counter` is the recipes sync counter reported by the status endpoint
+        and is only recorded once every changed recipe has been fetched, so a
+        partially failed sync is retried on the next run.  Fetched recipes
+        are saved as they arrive, so an interrupted first sync of a large
+        catalogue resumes where it stopped.  Returns True if any recipe
+        changed.
+        """
+        async with self._lock:
+            listing = await self.coordinator._api_get(RECIPES_ENDPOINT)
+            remote = {item["uid"]: item["hash"] for item in listing["result"]}
+
+            removed = [uid for uid in self.recipes if uid not in remote]
+            wanted = [
+                uid
+                for uid, recipe_hash in remote.items()
+                if self.recipes.get(uid, {}).get("hash") != recipe_hash
+            ]
+            for uid in removed:
+                del self.recipes[uid]
+                self.index.remove(uid)
+
+            semaphore = asyncio.Semaphore(RECIPE_FETCH_CONCURRENCY)
+
+            async def _fetch(uid: str) -> bool:
+                async with semaphore:
+                    try:
+                        data = await self.coordinator._api_get(
+                            f"{RECIPE_ENDPOINT}/{uid}"
+                        )
+                    except UpdateFailed as err:
+                        _LOGGER.debug("Failed to fetch recipe %s: %s", uid, err)
+                        return False
+                result = data["result"]
+                recipe = {field: result.get(field) for field in RECIPE_FIELDS}
+                recipe["uid"] = uid
+                recipe["hash"] = remote[uid]
+                self.recipes[uid] = recipe
+                self.index.add(uid, recipe)
+                self._store.async_delay_save(self._data_to_save, RECIPES_SAVE_DELAY)
+                return True
+
+            results = await asyncio.gather(*(_fetch(uid) for uid in wanted))
+
+            failed = results.count(False)
+            changed = bool(removed) or len(wanted) > failed
+            if not failed and counter != self.counter:
+                self.counter = counter
+                changed = True
+            if changed:
+                self._store.async_delay_save(self._data_to_save, RECIPES_SAVE_DELAY)
+
+            _LOGGER.debug(
+                "Recipe sync: %d fetched, %d failed, %d removed, %d total",
+                len(wanted) - failed,
+                failed,
+                len(removed),
+                len(self.recipes),
+            )
+            return changed
+
+    def _data_to_save(self) -> dict:
+        """Return the data to persist."""
+        return {"counter": self.counter, "recipes": self.recipes}
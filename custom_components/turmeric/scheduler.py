@@ -0,0 +1,132 @@
+"""Process-wide request scheduler shared by all Turmeric config entries."""
+import asyncio
+import heapq
+import itertools
+import random
+from email.utils import parsedate_to_datetime
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    API_BURST,
+    API_RATE_LIMIT,
+    DATA_SCHEDULER,
+    DOMAIN,
+    RETRY_BASE_DELAY,
+    RETRY_JITTER,
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds requested by a Retry-After header."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - dt_util.utcnow()).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Return how long to wait before retry `attempt`, with random jitter.
+
+    Honours the server's Retry-After when given, otherwise backs off
+    exponentially (1s, 2s, 4s, ...).  Jitter keeps entries that were
+    throttled together from retrying in lockstep.
+    """
+    delay = retry_after if retry_after is not None else RETRY_BASE_DELAY * 2**attempt
+    return delay + random.uniform(0, max(delay, RETRY_BASE_DELAY) * RETRY_JITTER)
+
+
+@callback
+def async_get_scheduler(hass) -> "TurmericRequestScheduler":
+    """Return the scheduler shared by every config entry, creating it once."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_SCHEDULER not in domain_data:
+        domain_data[DATA_SCHEDULER] = TurmericRequestScheduler(hass)
+    return domain_data[DATA_SCHEDULER]
+
+
+class TurmericRequestScheduler:
+    """Token bucket that hands out request slots by priority.
+
+    Every Paprika request of every config entry waits for a slot here, so
+    several accounts behind one IP share a single request budget.  Waiting
+    requests are served highest priority first (callers pass how stale the
+    collection they are fetching is), and a 429 pauses all requests until
+    the server's Retry-After has passed.
+    """
+
+    def __init__(self, hass, rate: float = API_RATE_LIMIT, burst: int = API_BURST) -> None:
+        """Initialise the scheduler with `rate` requests per second."""
+        self.hass = hass
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = hass.loop.time()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[float, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    async def async_acquire(self, priority: float = 0.0) -> None:
+        """Wait for a request slot; higher `priority` is served first."""
+        future = self.hass.loop.create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._sequence), future))
+        self._dispatch()
+        await future
+
+    @callback
+    def async_defer(self, delay: float) -> None:
+        """Hold back every request for `delay` seconds."""
+        self._paused_until = max(self._paused_until, self.hass.loop.time() + delay)
+        self._schedule(delay)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the dispatch timer and every waiting request."""
+        self._cancel_timer()
+        for _, _, future in self._waiters:
+            future.cancel()
+        self._waiters.clear()
+
+    @callback
+    def _dispatch(self) -> None:
+        """Grant slots to waiters while tokens are available."""
+        self._cancel_timer()
+        now = self.hass.loop.time()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+        if now < self._paused_until:
+            self._schedule(self._paused_until - now)
+            return
+
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():  # waiter was cancelled
+                continue
+            future.set_result(None)
+            self._tokens -= 1
+
+        if self._waiters:
+            self._schedule((1 - self._tokens) / self._rate)
+
+    @callback
+    def _schedule(self, delay: float) -> None:
+        """(Re)arm the dispatch timer."""
+        self._cancel_timer()
+        self._timer = self.hass.loop.call_later(delay, self._dispatch)
+
+    @callback
+    def _cancel_timer(self) -> None:
+        """Cancel the pending dispatch timer, if any."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
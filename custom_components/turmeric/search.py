@@ -0,0 +1,111 @@
+"""Inverted index for searching synced Paprika recipes."""
+import heapq
+import math
+import re
+from collections import defaultdict
+
+from .const import RECIPE_SEARCH_WEIGHTS
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _normalise(term: str) -> str:
+    """Fold simple English plurals so "chickpeas" matches "chickpea"."""
+    if len(term) > 4 and term.endswith("ies"):
+        return term[:-3] + "y"
+    if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+        return term[:-1]
+    return term
+
+
+def tokenize(text) -> list[str]:
+    """Split text into normalised search terms."""
+    if not isinstance(text, str):
+        return []
+    return [_normalise(term) for term in _TOKEN_RE.findall(text.lower())]
+
+
+class RecipeSearchIndex:
+    """Weighted inverted index over recipe text and ingredients.
+
+    Every term maps to the recipes containing it along with a field-weighted
+    term frequency, so a query only touches the postings of its own terms.
+    Recipes are added and removed one at a time as the catalogue syncs.
+    """
+
+    def __init__(self) -> None:
+        """Initialise an empty index."""
+        self._postings: dict[str, dict[str, float]] = defaultdict(dict)
+        self._ingredient_postings: dict[str, dict[str, float]] = defaultdict(dict)
+        self._doc_terms: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+
+    @classmethod
+    def from_recipes(cls, recipes: dict[str, dict]) -> "RecipeSearchIndex":
+        """Build an index over a uid -> recipe mapping."""
+        index = cls()
+        for uid, recipe in recipes.items():
+            index.add(uid, recipe)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed recipes."""
+        return len(self._doc_terms)
+
+    def add(self, uid: str, recipe: dict) -> None:
+        """Index (or re-index) a recipe; trashed recipes are left out."""
+        self.remove(uid)
+        if recipe.get("in_trash"):
+            return
+
+        weights: dict[str, float] = defaultdict(float)
+        for field, weight in RECIPE_SEARCH_WEIGHTS.items():
+            for term in tokenize(recipe.get(field)):
+                weights[term] += weight
+        ingredients: dict[str, float] = defaultdict(float)
+        for term in tokenize(recipe.get("ingredients")):
+            ingredients[term] += 1.0
+
+        for term, weight in weights.items():
+            self._postings[term][uid] = weight
+        for term, weight in ingredients.items():
+            self._ingredient_postings[term][uid] = weight
+        self._doc_terms[uid] = (frozenset(weights), frozenset(ingredients))
+
+    def remove(self, uid: str) -> None:
+        """Drop a recipe from the index."""
+        terms = self._doc_terms.pop(uid, None)
+        if terms is None:
+            return
+        for postings, doc_terms in zip(
+            (self._postings, self._ingredient_postings), terms
+        ):
+            for term in doc_terms:
+                postings[term].pop(uid, None)
+                if not postings[term]:
+                    del postings[term]
+
+    def search(
+        self, query: str, limit: int, ingredients_only: bool = False
+    ) -> list[tuple[str, int, float]]:
+        """Return up to `limit` (uid, matched terms, score), best match first.
+
+        Recipes matching more of the query terms rank first; ties are broken
+        by the sum of field-weighted term frequency times inverse document
+        frequency.
+        """
+        postings = self._ingredient_postings if ingredients_only else self._postings
+        total = len(self._doc_terms)
+        scores: dict[str, float] = defaultdict(float)
+        matched: dict[str, int] = defaultdict(int)
+
+        for term in set(tokenize(query)):
+            docs = postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + total / len(docs))
+            for uid, weight in docs.items():
+                scores[uid] += weight * idf
+                matched[uid] += 1
+
+        best = heapq.nlargest(limit, scores, key=lambda uid: (matched[uid], scores[uid]))
+        return [(uid, matched[uid], scores[uid]) for uid in best]
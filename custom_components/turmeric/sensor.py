@@ -1,21 +1,21 @@
 """Sensor platform for Turmeric integration."""
-<<<<<<< HEAD
-from datetime import datetime, timezone
-=======
-from datetime import datetime, time, timezone
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
+import hashlib
+from datetime import timedelta
 
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-<<<<<<< HEAD
-from .const import DOMAIN, MEAL_TYPES
+from .const import DOMAIN
+from .parser import DEFAULT_AISLE
+from .views import GroceryList
 
-_LOGGER = __import__("logging").getLogger(__name__)
+# Only the diagnostic metric sensors poll; they read in-memory counters
+SCAN_INTERVAL = timedelta(minutes=1)
 
-=======
-from .const import DOMAIN
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
+# Shown by list sensors while their list has no items
+EMPTY_LIST = GroceryList(())
 
 
 class TurmericSensor(CoordinatorEntity, Entity):
@@ -25,6 +25,7 @@ class TurmericSensor(CoordinatorEntity, Entity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.type = sensor_type
+        self._written: tuple | None = None
 
     @property
     def name(self):
@@ -36,136 +37,260 @@ class TurmericSensor(CoordinatorEntity, Entity):
         """Return a unique ID for the sensor."""
         return f"turmeric_{self.type}"
 
+    @property
+    def available(self):
+        """Return True if this sensor's collection was last polled successfully."""
+        return self.coordinator.collections[self.type].available
+
+    def _view(self):
+        """Return the data this sensor shows, or None if there is none yet.
+
+        The groceries sensor shows the default grocery list.
+        """
+        view = self.coordinator.data and self.coordinator.data.get(self.type)
+        if view is not None and self.type == "groceries":
+            return view.default
+        return view
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if this sensor's data, availability or day changed.
+
+        Views and grocery list partitions are reused while unchanged, so an
+        identity check is enough for the data.  The meals sensor is also
+        written when the coordinator rolls over to a new day.
+        """
+        day = self.coordinator.today if self.type == "meals" else None
+        written = (self._view(), self.available, day)
+        if (
+            self._written is not None
+            and written[0] is self._written[0]
+            and written[1:] == self._written[1:]
+        ):
+            return
+        self._written = written
+        super()._handle_coordinator_update()
+
     @property
     def state(self):
         """Return the state of the sensor."""
-        try:
-            if self.type == "groceries":
-                items = [
-                    item["name"]
-                    for item in self.coordinator.data["groceries"]["result"]
-                    if isinstance(item, dict) and "name" in item
-                ]
-                return (
-                    ", ".join(items)
-                    if len(items) <= 5
-                    else f"{len(items)} items available"
-                )
-            elif self.type == "meals":
-                today = datetime.now(timezone.utc).replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-                meals = [
-                    meal
-                    for meal in self.coordinator.data["meals"]["result"]
-<<<<<<< HEAD
-                    if isinstance(meal, dict) and "date" in meal
-                    and datetime.strptime(meal["date"], "%Y-%m-%d %H:%M:%S")
-=======
-                    if datetime.strptime(meal["date"], "%Y-%m-%d %H:%M:%S")
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
-                    .replace(tzinfo=timezone.utc)
-                    >= today
-                ][:7]
-                return (
-                    f"{len(meals)} upcoming meals"
-                    if meals
-                    else "No upcoming meals"
-                )
-<<<<<<< HEAD
-        except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.warning("Error computing state for %s: %s", self.type, err)
-=======
-        except (KeyError, TypeError):
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
+        view = self._view()
+        if view is None:
             return "Data unavailable"
 
+        if self.type == "groceries":
+            return view.state
+        elif self.type == "meals":
+            meals = view.upcoming(self.coordinator.today)
+            return f"{len(meals)} upcoming meals" if meals else "No upcoming meals"
+
     @property
     def extra_state_attributes(self):
         """Return additional state attributes."""
-        try:
-            if self.type == "groceries":
-                aisles: dict[str, list[str]] = {}
-                for item in self.coordinator.data["groceries"]["result"]:
-                    if not isinstance(item, dict) or "name" not in item:
-                        continue
-                    aisle = item.get("aisle", "Uncategorized")
-                    aisles.setdefault(aisle, []).append(item["name"])
-                return {"aisles": aisles}
-
-            elif self.type == "meals":
-                today = datetime.now(timezone.utc).replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-<<<<<<< HEAD
-                meals_list = []
-
-                for meal in sorted(
-                    self.coordinator.data["meals"]["result"],
-                    key=lambda x: (x.get("date", ""), x.get("type", 0)),
-                    reverse=True,
-                ):
-                    if not isinstance(meal, dict) or "name" not in meal or "date" not in meal:
-                        continue
-
-                    try:
-                        meal_date = datetime.strptime(meal["date"], "%Y-%m-%d %H:%M:%S")
-                        meal_date_utc = meal_date.replace(tzinfo=timezone.utc)
-                    except ValueError:
-                        _LOGGER.warning("Invalid meal date format: %s", meal.get("date"))
-                        continue
-
-                    if meal_date_utc >= today:
-                        meal_type = meal.get("type", 2)
-                        meals_list.append(
-                            {
-                                "name": meal["name"],
-                                "date": meal["date"],
-                                "type": MEAL_TYPES.get(meal_type, "Meal"),
-                            }
-                        )
-
-                return {"meals": meals_list[:7]}
-
-        except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.warning("Error computing attributes for %s: %s", self.type, err)
-=======
-                type_names = {
-                    0: "Breakfast",
-                    1: "Lunch",
-                    2: "Dinner",
-                    3: "Snack",
-                }
-                return {
-                    "meals": [
-                        {
-                            "name": meal["name"],
-                            "date": meal["date"],
-                            "type": type_names.get(
-                                meal.get("type", 2), "Meal"
-                            ),
-                        }
-                        for meal in sorted(
-                            self.coordinator.data["meals"]["result"],
-                            key=lambda x: (x["date"], x.get("type", 0)),
-                            reverse=True,
-                        )
-                        if datetime.strptime(meal["date"], "%Y-%m-%d %H:%M:%S")
-                        .replace(tzinfo=timezone.utc)
-                        >= today
-                    ][:7]
-                }
-        except (KeyError, TypeError):
->>>>>>> d606a24d74e32d92a3c366ffe03c4c1908295b35
+        view = self._view()
+        if view is None:
             return {"error": "Data unavailable"}
 
+        if self.type == "groceries":
+            return {"aisles": view.aisles}
+        elif self.type == "meals":
+            return {"meals": view.upcoming(self.coordinator.today)}
+
+
+class TurmericCompactSensor(TurmericSensor):
+    """Turmeric sensor whose list attributes are left out of the recorder.
+
+    The full lists stay available as live attributes and through the
+    `turmeric.get_lists` service; only the state itself is recorded.
+    """
+
+    _unrecorded_attributes = frozenset({"aisles", "meals"})
+
+
+class TurmericGroceryListSensor(TurmericSensor):
+    """Items of one additional Paprika grocery list."""
+
+    def __init__(self, coordinator, entry_id, list_uid):
+        """Initialize the sensor."""
+        super().__init__(coordinator, "groceries")
+        self._entry_id = entry_id
+        self.list_uid = list_uid
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        lists = self.coordinator.data and self.coordinator.data.get("grocerylists")
+        record = lists.items.get(self.list_uid) if lists is not None else None
+        return f"Turmeric Groceries {record.name if record else self.list_uid}"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID for the sensor."""
+        return f"turmeric_groceries_{self._entry_id}_{self.list_uid}"
+
+    def _view(self):
+        """Return this list's partition of the grocery view."""
+        view = self.coordinator.data and self.coordinator.data.get("groceries")
+        if view is None:
+            return None
+        return view.lists.get(self.list_uid, EMPTY_LIST)
+
+
+class TurmericCompactGroceryListSensor(TurmericGroceryListSensor):
+    """Grocery list sensor whose `aisles` attribute is not recorded."""
+
+    _unrecorded_attributes = frozenset({"aisles"})
+
+
+class TurmericAisleSensor(CoordinatorEntity, Entity):
+    """Number of grocery items in one aisle."""
+
+    _attr_unit_of_measurement = "items"
+
+    def __init__(self, coordinator, entry_id, aisle):
+        """Initialize the aisle sensor."""
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+        self.aisle = aisle
+        self._written: tuple | None = None
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"Turmeric Aisle {self.aisle or DEFAULT_AISLE}"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID for the sensor.
+
+        Keyed on a hash of the raw aisle name: names that slugify alike
+        (or the empty aisle of items added from Home Assistant) must still
+        get distinct IDs.
+        """
+        digest = hashlib.sha1(self.aisle.encode()).hexdigest()[:16]
+        return f"turmeric_aisle_{self._entry_id}_{digest}"
+
+    @property
+    def available(self):
+        """Return True if the grocery list was last polled successfully."""
+        return self.coordinator.collections["groceries"].available
+
+    @property
+    def state(self):
+        """Return how many items are listed in this aisle."""
+        view = self.coordinator.data and self.coordinator.data.get("groceries")
+        if view is None:
+            return None
+        return view.aisle_counts.get(self.aisle, 0)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if this aisle's count or availability changed."""
+        written = (self.state, self.available)
+        if written == self._written:
+            return
+        self._written = written
+        super()._handle_coordinator_update()
+
+
+class TurmericMetricSensor(Entity):
+    """Request metrics of one Paprika endpoint (disabled by default).
+
+    The state is the average latency in milliseconds; counters, bytes,
+    parse time and the latency histogram are attributes.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = True
+    _attr_unit_of_measurement = "ms"
+
+    def __init__(self, coordinator, entry_id, endpoint):
+        """Initialize the metric sensor."""
+        self.coordinator = coordinator
+        self._entry_id = entry_id
+        self.endpoint = endpoint
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"Turmeric {self.endpoint.replace('_', ' ').title()} API Latency"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID for the sensor."""
+        return f"turmeric_api_{self.endpoint}_{self._entry_id}"
+
+    @property
+    def state(self):
+        """Return the average latency of the endpoint."""
+        return self.coordinator.metrics.get(self.endpoint).as_dict()["average_latency_ms"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return the endpoint's counters and latency histogram."""
+        return self.coordinator.metrics.get(self.endpoint).as_dict()
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up Turmeric sensors based on a config entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    options = config_entry.options
 
+    compact = options.get("compact_history")
+    sensor_class = TurmericCompactSensor if compact else TurmericSensor
+    list_sensor_class = (
+        TurmericCompactGroceryListSensor if compact else TurmericGroceryListSensor
+    )
     sensors = [
-        TurmericSensor(coordinator, "groceries"),
-        TurmericSensor(coordinator, "meals"),
+        sensor_class(coordinator, "groceries"),
+        sensor_class(coordinator, "meals"),
+    ]
+    endpoints = ["status", "groceries", "meals", "grocerylists", "groceries_upload"]
+    if coordinator.recipes is not None:
+        endpoints += ["recipes", "recipe"]
+    sensors += [
+        TurmericMetricSensor(coordinator, config_entry.entry_id, endpoint)
+        for endpoint in endpoints
     ]
     async_add_entities(sensors)
+
+    known_lists: set[str] = set()
+    known_aisles: set[str] = set()
+
+    @callback
+    def _async_add_new_sensors() -> None:
+        """Add sensors for grocery lists and aisles that appeared since the last update.
+
+        The default list is shown by the groceries sensor itself.
+        """
+        data = coordinator.data or {}
+        lists = data.get("grocerylists")
+        if lists is not None:
+            new_lists = [
+                list_uid
+                for list_uid in lists.items
+                if list_uid != lists.default_uid and list_uid not in known_lists
+            ]
+            if new_lists:
+                known_lists.update(new_lists)
+                async_add_entities(
+                    list_sensor_class(coordinator, config_entry.entry_id, list_uid)
+                    for list_uid in new_lists
+                )
+
+        view = data.get("groceries")
+        if view is None or not options.get("aisle_sensors"):
+            return
+        new_aisles = [aisle for aisle in view.aisle_counts if aisle not in known_aisles]
+        if new_aisles:
+            known_aisles.update(new_aisles)
+            async_add_entities(
+                TurmericAisleSensor(coordinator, config_entry.entry_id, aisle)
+                for aisle in new_aisles
+            )
+
+    _async_add_new_sensors()
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(_async_add_new_sensors)
+    )
@@ -0,0 +1,114 @@
+"""Persistent snapshot of the last good Paprika payloads for Turmeric."""
+import base64
+import json
+import logging
+import zlib
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, SNAPSHOT_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _encode_payload(payload: dict) -> str:
+    """Compress a decoded payload into a base64 string."""
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.b64encode(zlib.compress(raw)).decode("ascii")
+
+
+def _decode_payload(blob: str) -> dict:
+    """Inverse of `_encode_payload`."""
+    return json.loads(zlib.decompress(base64.b64decode(blob)))
+
+
+class TurmericSnapshotStore:
+    """Versioned, compressed on-disk copy of the last fetched collections.
+
+    Payloads are zlib-compressed and base64-encoded before they are handed to
+    HA's Store helper, which keeps the file small even for long grocery lists
+    and meal histories.  Each collection is only re-encoded after it changes.
+    """
+
+    def __init__(self, hass, entry_id: str) -> None:
+        """Initialise the snapshot store for one config entry."""
+        self.hass = hass
+        self._store = Store(
+            hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry_id}.snapshot", private=True
+        )
+        self._records: dict[str, list] = {}
+        self._encoded: dict[str, str] = {}
+        self._counters: dict[str, int] = {}
+
+    async def async_load(self) -> dict | None:
+        """Load the snapshot, returning None if there is nothing usable.
+
+        The result maps `collections` to decoded payloads keyed by name and
+        carries the sync `counters` and `saved_at` timestamp alongside.
+        """
+        try:
+            stored = await self._store.async_load()
+        except Exception as err:  # corrupt file, unknown future version, ...
+            _LOGGER.warning("Ignoring unreadable Turmeric snapshot: %s", err)
+            return None
+
+        if not stored or not isinstance(stored.get("collections"), dict):
+            return None
+
+        encoded = {
+            name: blob
+            for name, blob in stored["collections"].items()
+            if isinstance(blob, str)
+        }
+        try:
+            payloads = await self.hass.async_add_executor_job(
+                lambda: {name: _decode_payload(blob) for name, blob in encoded.items()}
+            )
+        except (ValueError, zlib.error) as err:
+            _LOGGER.warning("Ignoring corrupt Turmeric snapshot: %s", err)
+            return None
+
+        self._encoded = encoded
+        self._counters = dict(stored.get("counters") or {})
+        saved_at = stored.get("saved_at")
+
+        return {
+            "collections": payloads,
+            "counters": dict(self._counters),
+            "saved_at": dt_util.parse_datetime(saved_at) if saved_at else None,
+        }
+
+    def async_schedule_save(
+        self, collections: dict[str, list | None], counters: dict[str, int]
+    ) -> None:
+        """Record the latest records and write them after a short delay.
+
+        Records are only converted back to Paprika's JSON form when the
+        snapshot is written.
+        """
+        for name, records in collections.items():
+            if records is None or records is self._records.get(name):
+                continue
+            self._records[name] = records
+            self._encoded.pop(name, None)
+        self._counters = dict(counters)
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict:
+        """Return the data to persist, encoding only changed collections."""
+        for name, records in self._records.items():
+            if name not in self._encoded:
+                self._encoded[name] = _encode_payload(
+                    {"result": [record.to_item() for record in records]}
+                )
+
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            "counters": self._counters,
+            "collections": self._encoded,
+        }
+
+    async def async_remove(self) -> None:
+        """Delete the snapshot from disk."""
+        await self._store.async_remove()
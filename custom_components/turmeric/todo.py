@@ -0,0 +1,185 @@
+"""Todo platform for Turmeric integration."""
+import dataclasses
+import uuid
+
+from homeassistant.components.todo import (
+    TodoItem,
+    TodoItemStatus,
+    TodoListEntity,
+    TodoListEntityFeature,
+)
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .diff import diff_keyed
+from .parser import GroceryRecord
+
+
+def _to_todo_item(uid: str, record: GroceryRecord) -> TodoItem:
+    """Build a todo item from a grocery record."""
+    return TodoItem(
+        uid=uid,
+        summary=record.name,
+        status=(
+            TodoItemStatus.COMPLETED if record.purchased else TodoItemStatus.NEEDS_ACTION
+        ),
+        description=record.aisle or None,
+    )
+
+
+class TurmericGroceryList(CoordinatorEntity, TodoListEntity):
+    """One Paprika grocery list as a todo list.
+
+    `list_uid` None stands for the default list.
+
+    Coordinator updates are applied as a keyed diff against the previous
+    grocery items, so only added, removed or changed items are rebuilt.
+    Items added or ticked off here are queued and uploaded in batches by the
+    coordinator's grocery writer.
+    """
+
+    _attr_supported_features = (
+        TodoListEntityFeature.CREATE_TODO_ITEM | TodoListEntityFeature.UPDATE_TODO_ITEM
+    )
+
+    def __init__(self, coordinator, entry_id, list_uid=None):
+        """Initialize the todo list."""
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+        self.list_uid = list_uid
+        self._source: dict[str, GroceryRecord] = {}
+        self._items: dict[str, TodoItem] = {}
+        self._attr_todo_items = []
+        self._written_available: bool | None = None
+
+    @property
+    def name(self):
+        """Return the name of the todo list."""
+        if self.list_uid is None:
+            return "Turmeric Groceries"
+        lists = self.coordinator.data and self.coordinator.data.get("grocerylists")
+        record = lists.items.get(self.list_uid) if lists is not None else None
+        return f"Turmeric Groceries {record.name if record else self.list_uid}"
+
+    @property
+    def unique_id(self):
+        """Return a unique ID for the todo list."""
+        if self.list_uid is None:
+            return f"turmeric_groceries_todo_{self._entry_id}"
+        return f"turmeric_groceries_todo_{self._entry_id}_{self.list_uid}"
+
+    @property
+    def available(self):
+        """Return True if the grocery list was last polled successfully."""
+        return self.coordinator.collections["groceries"].available
+
+    async def async_added_to_hass(self) -> None:
+        """Load the current items once added."""
+        await super().async_added_to_hass()
+        self._apply_items()
+
+    async def async_create_todo_item(self, item: TodoItem) -> None:
+        """Queue a new grocery item for upload to Paprika."""
+        list_uid = self.list_uid
+        if list_uid is None:
+            lists = self.coordinator.data and self.coordinator.data.get("grocerylists")
+            list_uid = lists.default_uid if lists is not None else None
+        if list_uid is None:
+            # Without list metadata, join the list the existing items belong to
+            list_uid = next((known.list_uid for known in self._source.values()), None)
+        record = GroceryRecord(
+            uid=str(uuid.uuid4()).upper(),
+            name=item.summary,
+            aisle="",
+            purchased=item.status == TodoItemStatus.COMPLETED,
+            quantity="",
+            ingredient=item.summary,
+            instruction="",
+            recipe=None,
+            recipe_uid=None,
+            order_flag=0,
+            separate=False,
+            aisle_uid=None,
+            list_uid=list_uid,
+        )
+        await self.coordinator.writer.async_queue(record.to_item())
+
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        """Queue a renamed or (un)checked grocery item for upload to Paprika."""
+        current = self._source.get(item.uid)
+        if current is None or not current.uid:
+            raise HomeAssistantError(f"Grocery item {item.uid} cannot be updated")
+        record = dataclasses.replace(
+            current,
+            name=item.summary or current.name,
+            purchased=item.status == TodoItemStatus.COMPLETED,
+        )
+        await self.coordinator.writer.async_queue(record.to_item())
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Apply the new grocery items and write state if anything changed."""
+        changed = self._apply_items()
+        if changed or self.available != self._written_available:
+            self._written_available = self.available
+            super()._handle_coordinator_update()
+
+    @callback
+    def _apply_items(self) -> bool:
+        """Diff the coordinator's grocery items into the todo items."""
+        view = self.coordinator.data and self.coordinator.data.get("groceries")
+        if view is None:
+            source = {}
+        elif self.list_uid is None:
+            source = view.default.items
+        elif self.list_uid in view.lists:
+            source = view.lists[self.list_uid].items
+        else:
+            source = {}
+        if source is self._source:
+            return False
+
+        diff = diff_keyed(self._source, source)
+        self._source = source
+        if not diff:
+            return False
+
+        for uid in diff.removed:
+            del self._items[uid]
+        for uid, item in diff.changed.items():
+            self._items[uid] = _to_todo_item(uid, item)
+        for uid, item in diff.added.items():
+            self._items[uid] = _to_todo_item(uid, item)
+        self._attr_todo_items = list(self._items.values())
+        return True
+
+
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    """Set up the Turmeric grocery todo lists based on a config entry."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities([TurmericGroceryList(coordinator, config_entry.entry_id)])
+
+    known_lists: set[str] = set()
+
+    @callback
+    def _async_add_new_lists() -> None:
+        """Add a todo list for every additional grocery list that appeared."""
+        lists = coordinator.data and coordinator.data.get("grocerylists")
+        if lists is None:
+            return
+        new_lists = [
+            list_uid
+            for list_uid in lists.items
+            if list_uid != lists.default_uid and list_uid not in known_lists
+        ]
+        if new_lists:
+            known_lists.update(new_lists)
+            async_add_entities(
+                TurmericGroceryList(coordinator, config_entry.entry_id, list_uid)
+                for list_uid in new_lists
+            )
+
+    _async_add_new_lists()
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_new_lists))
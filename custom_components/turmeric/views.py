@@ -0,0 +1,221 @@
+"""Precomputed views over Turmeric coordinator data.
+
+A view is built once from the parsed records whenever the coordinator
+receives a new payload, so entities read ready-made values instead of
+re-walking the lists every time Home Assistant asks for their state or
+attributes.
+"""
+from bisect import bisect_left
+from collections import Counter
+from datetime import date, datetime, time, timezone
+from operator import itemgetter
+from typing import NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+from .const import MEAL_TYPES, UPCOMING_MEALS
+from .parser import GroceryListRecord, GroceryRecord, MealRecord
+
+
+class GroceryList:
+    """Items keyed by uid, names and aisle buckets of one grocery list."""
+
+    def __init__(self, records: tuple[GroceryRecord, ...]) -> None:
+        """Build the partition from the list's grocery records."""
+        names: list[str] = []
+        aisles: dict[str, list[str]] = {}
+        items: dict[str, GroceryRecord] = {}
+        for record in records:
+            items[_grocery_key(record, items)] = record
+            names.append(record.name)
+            aisles.setdefault(record.aisle, []).append(record.name)
+
+        self.records = records
+        self.items = items
+        self.names = names
+        self.aisles = aisles
+        self.state = (
+            ", ".join(names) if len(names) <= 5 else f"{len(names)} items available"
+        )
+
+
+class GroceryView:
+    """Grocery items partitioned by grocery list.
+
+    `lists` maps each list uid to its GroceryList.  Partitions whose records
+    did not change are reused from the `previous` view, so entities of one
+    list can tell by identity that a change elsewhere does not concern them.
+    `default` is the default list, or every item while the list metadata is
+    unknown.
+    """
+
+    def __init__(
+        self,
+        records: list[GroceryRecord],
+        default_list: str | None = None,
+        previous: "GroceryView | None" = None,
+    ) -> None:
+        """Build the view from parsed grocery records."""
+        groups: dict[str | None, list[GroceryRecord]] = {}
+        for record in records:
+            groups.setdefault(record.list_uid or default_list, []).append(record)
+
+        old = previous.lists if previous is not None else {}
+        self.lists = {
+            list_uid: _reuse(old.get(list_uid), tuple(group))
+            for list_uid, group in groups.items()
+        }
+        previous_default = previous.default if previous is not None else None
+        if default_list is None:
+            self.default = _reuse(previous_default, tuple(records))
+        else:
+            self.default = self.lists.get(default_list) or _reuse(previous_default, ())
+
+        self.items: dict[str, GroceryRecord] = {}
+        for partition in self.lists.values():
+            self.items.update(partition.items)
+        self.aisle_counts = Counter(record.aisle for record in records)
+
+
+def _reuse(partition: GroceryList | None, records: tuple) -> GroceryList:
+    """Return `partition` if it holds exactly `records`, else a new one."""
+    if partition is not None and partition.records == records:
+        return partition
+    return GroceryList(records)
+
+
+class GroceryListsView:
+    """Grocery list metadata in Paprika's display order."""
+
+    def __init__(self, records: list[GroceryListRecord]) -> None:
+        """Build the view from parsed grocery list records."""
+        ordered = sorted(records, key=lambda record: record.order_flag)
+        self.items = {record.uid: record for record in ordered}
+        self.default_uid = next(
+            (record.uid for record in ordered if record.is_default),
+            ordered[0].uid if ordered else None,
+        )
+
+
+def _grocery_key(record: GroceryRecord, seen: dict) -> str:
+    """Return a stable key for a grocery item.
+
+    Paprika items carry a uid; items without one fall back to their list and
+    name, numbered when the same name appears more than once.  The list is
+    part of the key so partitions merged into GroceryView.items cannot
+    collide.
+    """
+    if record.uid:
+        return record.uid
+    base = f"name:{record.list_uid or ''}:{record.name}"
+    key = base
+    count = 1
+    while key in seen:
+        count += 1
+        key = f"{base}#{count}"
+    return key
+
+
+def _meal_key(record: MealRecord) -> str:
+    """Return a stable key for a meal: its uid, else its slot and name."""
+    return record.uid or f"{record.date}|{record.type}|{record.name}"
+
+
+class MealEntry(NamedTuple):
+    """A meal with its parsed datetime and sensor attributes."""
+
+    when: datetime
+    type: int
+    attrs: dict
+    recipe_uid: str | None
+
+
+class MealIndex:
+    """Meals ordered by (datetime, meal type) for binary-search queries.
+
+    Queries cost O(log n + k) for k results, so a long meal-plan history is
+    as cheap to query as an empty one.
+    """
+
+    def __init__(self, entries: list[MealEntry]) -> None:
+        """Build the index from meal entries."""
+        entries = sorted(entries, key=itemgetter(0, 1))
+        self._keys = [(entry.when, entry.type) for entry in entries]
+        self._entries = entries
+
+    def __len__(self) -> int:
+        """Return the number of indexed meals."""
+        return len(self._entries)
+
+    def next(self, start: datetime, count: int) -> list[MealEntry]:
+        """Return up to `count` meals at or after `start`."""
+        first = bisect_left(self._keys, (start,))
+        return self._entries[first : first + count]
+
+    def between(self, start: datetime, end: datetime) -> list[MealEntry]:
+        """Return the meals in the half-open range [start, end)."""
+        return self._entries[
+            bisect_left(self._keys, (start,)) : bisect_left(self._keys, (end,))
+        ]
+
+
+class MealView:
+    """Meals keyed by uid, indexed by date and meal type."""
+
+    def __init__(self, records: list[MealRecord]) -> None:
+        """Build the view from parsed meal records."""
+        self.items = {_meal_key(record): record for record in records}
+        entries = [
+            MealEntry(
+                record.when,
+                record.type,
+                {
+                    "name": record.name,
+                    "date": record.date,
+                    "type": MEAL_TYPES.get(record.type, "Meal"),
+                },
+                record.recipe_uid,
+            )
+            for record in records
+        ]
+
+        self.index = MealIndex(entries)
+        self._upcoming: tuple[datetime | None, list[dict]] = (None, [])
+
+    def upcoming(self, today: datetime) -> list[dict]:
+        """Return attributes of the next UPCOMING_MEALS meals from `today`.
+
+        The result is cached until `today` changes.
+        """
+        if self._upcoming[0] != today:
+            self._upcoming = (
+                today,
+                [entry.attrs for entry in self.index.next(today, UPCOMING_MEALS)],
+            )
+        return self._upcoming[1]
+
+    def between_days(self, first: date, last: date) -> list[MealEntry]:
+        """Return meals planned on days in [first, last).
+
+        Each meal occupies its whole day, so a meal overlaps a range of days
+        exactly when its own day falls inside it.
+        """
+        return self.index.between(_day_start(first), _day_start(last))
+
+    def next_from_day(self, day: date, count: int) -> list[MealEntry]:
+        """Return up to `count` meals planned on `day` or later."""
+        return self.index.next(_day_start(day), count)
+
+
+def _day_start(day: date) -> datetime:
+    """Return the index key for midnight of `day`."""
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def start_of_today() -> datetime:
+    """Return the index key for midnight of the current local day.
+
+    Paprika meal dates are local wall-clock times, so the day is taken from
+    Home Assistant's time zone rather than UTC.
+    """
+    return _day_start(dt_util.now().date())
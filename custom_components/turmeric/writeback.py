@@ -0,0 +1,143 @@
+"""Batched write-back of grocery changes to Paprika."""
+import logging
+from datetime import datetime
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import GROCERIES_ENDPOINT, WRITEBACK_DELAY, WRITEBACK_MAX_RETRY_DELAY
+from .parser import GroceryRecord, parse_grocery
+from .scheduler import backoff_delay
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TurmericGroceryWriter:
+    """Queue grocery edits and upload them to Paprika in batches.
+
+    Edits are applied to the coordinator's data straight away and uploaded
+    together once no new edit arrived for WRITEBACK_DELAY seconds, so ticking
+    off a dozen items costs one request instead of twelve.  Queued and
+    in-flight edits are overlaid on every fetched grocery list until Paprika
+    has them, and failed uploads are retried with backoff.
+    """
+
+    def __init__(self, coordinator) -> None:
+        """Initialise the writer for a coordinator."""
+        self.coordinator = coordinator
+        self.hass = coordinator.hass
+        self._pending: dict[str, dict] = {}
+        self._in_flight: dict[str, dict] = {}
+        self._failures = 0
+        self._unsub_retry = None
+        self._unsub_flush = None
+        self._shutting_down = False
+
+    @property
+    def pending(self) -> int:
+        """Return the number of edits not yet confirmed by Paprika."""
+        return len({**self._in_flight, **self._pending})
+
+    def overlay(self, records: list[GroceryRecord]) -> list[GroceryRecord]:
+        """Return `records` with the queued edits applied."""
+        edits = {**self._in_flight, **self._pending}
+        if not edits:
+            return records
+
+        result = [
+            parse_grocery(edits.pop(record.uid)) if record.uid in edits else record
+            for record in records
+        ]
+        result.extend(parse_grocery(item) for item in edits.values())
+        return result
+
+    async def async_queue(self, item: dict) -> None:
+        """Queue a new or changed grocery item and show it right away."""
+        self._pending[item["uid"]] = item
+        self.coordinator.async_apply_local_changes()
+        self._schedule_flush()
+
+    async def async_shutdown(self) -> None:
+        """Upload whatever is still queued; called when the entry unloads.
+
+        The final upload is not retried and does not refresh the list.
+        """
+        self._shutting_down = True
+        self._cancel_flush()
+        self._cancel_retry()
+        await self._async_flush()
+
+    @callback
+    def _schedule_flush(self) -> None:
+        """(Re)start the WRITEBACK_DELAY countdown to the next upload."""
+        self._cancel_flush()
+        self._unsub_flush = async_call_later(
+            self.hass, WRITEBACK_DELAY, self._async_scheduled_flush
+        )
+
+    async def _async_scheduled_flush(self, _now: datetime) -> None:
+        """Upload the queued edits once no edit arrived for a while."""
+        self._unsub_flush = None
+        await self._async_flush()
+
+    async def _async_flush(self) -> None:
+        """Upload the queued edits as one batch."""
+        if not self._pending or self._in_flight:
+            return
+
+        self._in_flight, self._pending = self._pending, {}
+        try:
+            await self.coordinator.async_upload(
+                GROCERIES_ENDPOINT, list(self._in_flight.values())
+            )
+        except UpdateFailed as err:
+            # Newer edits of the same items win over the failed batch
+            self._pending = {**self._in_flight, **self._pending}
+            self._in_flight = {}
+            if self._shutting_down:
+                _LOGGER.warning(
+                    "Uploading %d grocery changes failed while unloading: %s",
+                    len(self._pending),
+                    err,
+                )
+                return
+            self._failures += 1
+            delay = min(backoff_delay(self._failures), WRITEBACK_MAX_RETRY_DELAY)
+            _LOGGER.warning(
+                "Uploading %d grocery changes failed, retrying in %.0f seconds: %s",
+                len(self._pending),
+                delay,
+                err,
+            )
+            self._cancel_retry()
+            self._unsub_retry = async_call_later(self.hass, delay, self._async_retry)
+            return
+
+        _LOGGER.debug("Uploaded %d grocery changes", len(self._in_flight))
+        self._in_flight = {}
+        self._failures = 0
+        if self._shutting_down:
+            return
+        await self.coordinator.async_refresh_collection("groceries")
+        if self._pending:
+            self._schedule_flush()
+
+    async def _async_retry(self, _now: datetime) -> None:
+        """Retry a failed upload from the backoff timer."""
+        self._unsub_retry = None
+        await self._async_flush()
+
+    @callback
+    def _cancel_flush(self) -> None:
+        """Cancel a scheduled upload, if any."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+    @callback
+    def _cancel_retry(self) -> None:
+        """Cancel a scheduled retry, if any."""
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None